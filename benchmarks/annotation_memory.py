@@ -0,0 +1,67 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Measure the memory a loaded scene takes per annotation.
+
+The frames of the calibration scene from the test assets are duplicated until the scene is large
+enough for the per-annotation overhead to dominate. Run it from the root of the repository:
+
+    python benchmarks/annotation_memory.py --copies 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import raillabel
+
+_ASSET = Path(__file__).parents[1] / "tests" / "__test_assets__" / "1_calibration_1.1_labels.json"
+
+
+def _scaled_scene(copies: int, path: Path) -> None:
+    data = json.loads(_ASSET.read_text())
+    content = data["openlabel"]
+    frames = list(content["frames"].values())
+
+    content["frames"] = {
+        str(frame_id): frame
+        for frame_id, frame in enumerate(frame for _ in range(copies) for frame in frames)
+    }
+    content.pop("frame_intervals", None)
+    for obj in content["objects"].values():
+        obj.pop("frame_intervals", None)
+        obj.pop("object_data_pointers", None)
+
+    path.write_text(json.dumps(data))
+
+
+def main() -> None:
+    """Print the memory of the scaled scene per annotation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=20, help="number of copies of the frames")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "scene.json"
+        _scaled_scene(args.copies, path)
+
+        gc.collect()
+        tracemalloc.start()
+        scene = raillabel.load(path)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    annotations = sum(len(frame.annotations) for frame in scene.frames.values())
+    print(f"frames:                {len(scene.frames)}")
+    print(f"annotations:           {annotations}")
+    print(f"memory of the scene:   {retained / 2**20:.1f} MiB")
+    print(f"bytes per annotation:  {retained / annotations:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,24 @@ The first step in using raillabel is downloading a desired dataset
 
     scene = raillabel.load("path/to/annotation_file.json")
 
-This returns the root class for the annotations.
+This returns the root class for the annotations. Scenes can also be loaded from file objects with
+raillabel.load() or from the content of an annotation file with raillabel.loads().
+
+Very long scenes can also be processed one frame at a time without loading the whole file
+
+.. code-block:: python
+
+    for frame_id, frame in raillabel.iter_frames("path/to/annotation_file.json"):
+        pass  # do something with the frame here
+
+raillabel.SceneReader does the same, but also provides the rest of the scene, like the objects
+and sensors
+
+.. code-block:: python
+
+    with raillabel.SceneReader("path/to/annotation_file.json") as reader:
+        for frame_id, frame in reader:
+            pass  # reader.scene.objects contains the objects of the annotations
 
 If a file is too extensive for your use-case you can filter out certain parts of a scene like this
 
@@ -48,15 +65,32 @@ from importlib import metadata
 
 from . import filter, format
 from .format import Scene
-from .load.load import load
-from .save.save import save
+from .load.frame_index import read_frame_index, write_frame_index
+from .load.iter_frames import iter_frames
+from .load.load import aload, load, loads
+from .load.load_many import LoadResult, load_many
+from .load.scene_reader import SceneReader
+from .save.save import asave, save
+from .save.scene_writer import SceneWriter
+from .save.update_frames import update_frames
 
 __all__ = [
+    "aload",
+    "asave",
     "filter",
     "format",
     "Scene",
+    "SceneReader",
+    "SceneWriter",
+    "iter_frames",
     "load",
+    "load_many",
+    "loads",
+    "LoadResult",
+    "read_frame_index",
     "save",
+    "update_frames",
+    "write_frame_index",
 ]
 
 try:
@@ -0,0 +1,156 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+from io import BufferedIOBase
+from pathlib import Path
+from types import ModuleType
+from typing import IO
+
+_MAGIC_BYTES = {
+    b"\x1f\x8b": "gzip",
+    b"\xfd7zXZ\x00": "xz",
+    b"BZh": "bz2",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+_SUFFIXES = {
+    ".gz": "gzip",
+    ".xz": "xz",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+}
+
+
+def _compression_from_magic_bytes(path: Path | str) -> str | None:
+    """Return the compression of a file based on its first bytes or None if it is uncompressed."""
+    with Path(path).open("rb") as file:
+        return _compression_from_header(file.read(max(len(magic) for magic in _MAGIC_BYTES)))
+
+
+def _compression_from_header(header: bytes) -> str | None:
+    """Return the compression of data based on its first bytes or None if it is uncompressed."""
+    for magic, compression in _MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return compression
+
+    return None
+
+
+def _compression_from_suffix(path: Path | str) -> str | None:
+    """Return the compression indicated by the file extension or None if there is none."""
+    return _SUFFIXES.get(Path(path).suffix.lower())
+
+
+def _open_for_reading(path: Path | str) -> BufferedIOBase:
+    """Open a file for reading in binary mode and decompress it on the fly if necessary."""
+    compression = _compression_from_magic_bytes(path)
+
+    # the file is returned to the caller on purpose, who is responsible for closing it
+    if compression == "gzip":
+        return gzip.open(path, "rb")  # noqa: SIM115
+
+    if compression == "xz":
+        return lzma.open(path, "rb")  # noqa: SIM115
+
+    if compression == "bz2":
+        return bz2.open(path, "rb")  # noqa: SIM115
+
+    if compression == "zstd":
+        file = Path(path).open("rb")  # noqa: SIM115
+        return _zstandard().ZstdDecompressor().stream_reader(file, closefd=True)
+
+    return Path(path).open("rb")  # noqa: SIM115
+
+
+def _open_for_writing(path: Path | str) -> BufferedIOBase:
+    """Open a file for writing in binary mode and compress it according to its file extension."""
+    compression = _compression_from_suffix(path)
+
+    # the file is returned to the caller on purpose, who is responsible for closing it
+    if compression == "gzip":
+        return gzip.open(path, "wb")  # noqa: SIM115
+
+    if compression == "xz":
+        return lzma.open(path, "wb")  # noqa: SIM115
+
+    if compression == "bz2":
+        return bz2.open(path, "wb")  # noqa: SIM115
+
+    if compression == "zstd":
+        file = Path(path).open("wb")  # noqa: SIM115
+        return _zstandard().ZstdCompressor().stream_writer(file, closefd=True)
+
+    return Path(path).open("wb")  # noqa: SIM115
+
+
+def _compressing_writer(file: IO[bytes], path: Path | str) -> BufferedIOBase | None:
+    """Wrap an open binary file, so that data is compressed according to the extension of path.
+
+    In contrast to _open_for_writing(), the data can be written to a different file than the one
+    the path points to. Closing the returned writer does not close the file. None is returned if
+    the path does not indicate any compression.
+    """
+    compression = _compression_from_suffix(path)
+
+    # the writer is returned to the caller on purpose, who is responsible for closing it
+    if compression == "gzip":
+        # the file name stored in the gzip header is derived from the path, not the file
+        return gzip.GzipFile(filename=Path(path).name, mode="wb", fileobj=file)
+
+    if compression == "xz":
+        return lzma.LZMAFile(file, "wb")  # noqa: SIM115
+
+    if compression == "bz2":
+        return bz2.BZ2File(file, "wb")
+
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().stream_writer(file, closefd=False)
+
+    return None
+
+
+def _read_bytes(path: Path | str) -> bytes:
+    """Return the (decompressed) content of a file."""
+    with _open_for_reading(path) as file:
+        return file.read()
+
+
+def _decompress(data: bytes) -> bytes:
+    """Return the decompressed data or the data itself if it is not compressed."""
+    compression = _compression_from_header(data[: max(len(magic) for magic in _MAGIC_BYTES)])
+
+    if compression == "gzip":
+        return gzip.decompress(data)
+
+    if compression == "xz":
+        return lzma.decompress(data)
+
+    if compression == "bz2":
+        return bz2.decompress(data)
+
+    if compression == "zstd":
+        with _zstandard().ZstdDecompressor().stream_reader(data) as reader:
+            return reader.read()
+
+    return data
+
+
+def _zstandard() -> ModuleType:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ZstandardNotInstalledError from e
+    return zstandard
+
+
+class ZstandardNotInstalledError(ImportError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Reading and writing zstd compressed files requires the zstandard package. "
+            "It can be installed with 'pip install raillabel[zstd]'."
+        )
@@ -0,0 +1,23 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def _executor(workers: int) -> Executor:
+    """Return a pool of workers running tasks in parallel.
+
+    Processes are used as workers, unless the interpreter is a free-threaded build, where threads
+    run in parallel without the overhead of transferring the data between processes.
+    """
+    if _is_free_threaded():
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
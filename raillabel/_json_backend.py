@@ -0,0 +1,114 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+_JSON_BACKEND_ENVIRONMENT_VARIABLE = "RAILLABEL_JSON_BACKEND"
+"Environment variable selecting the JSON backend if none is passed explicitly."
+
+_FAST_BACKENDS = ("orjson", "msgspec", "simdjson")
+
+
+@dataclass(frozen=True)
+class _JSONBackend:
+    """Functions for parsing and serializing JSON with a specific library."""
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any, bool], bytes]
+    "Serialize the object. The second argument enables indentation."
+
+    indentation: int = 4
+    "Number of spaces per indentation level used by dumps."
+
+    def __reduce__(self) -> tuple:
+        # the functions are not necessarily picklable, which is why the backend is looked up again
+        return (_get_json_backend, (self.name,))
+
+
+def _get_json_backend(name: str | None) -> _JSONBackend | None:
+    """Return the JSON backend with the name or the one selected by the environment variable.
+
+    None is returned if no backend has been selected at all. "auto" selects the fastest installed
+    library and falls back to the standard library.
+    """
+    if name is None:
+        name = os.environ.get(_JSON_BACKEND_ENVIRONMENT_VARIABLE) or None
+
+    if name is None:
+        return None
+
+    if name == "auto":
+        name = next(
+            (lib for lib in _FAST_BACKENDS if importlib.util.find_spec(lib) is not None), "json"
+        )
+
+    if name not in _BACKEND_FACTORIES:
+        raise UnknownJSONBackendError(name)
+
+    return _BACKEND_FACTORIES[name]()
+
+
+def _stdlib_backend() -> _JSONBackend:
+    return _JSONBackend(name="json", loads=json.loads, dumps=_stdlib_dumps)
+
+
+def _stdlib_dumps(obj: Any, indent: bool) -> bytes:  # noqa: ANN401
+    if indent:
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _orjson_backend() -> _JSONBackend:
+    import orjson
+
+    def dumps(obj: Any, indent: bool) -> bytes:  # noqa: ANN401
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return _JSONBackend(name="orjson", loads=orjson.loads, dumps=dumps, indentation=2)
+
+
+def _msgspec_backend() -> _JSONBackend:
+    import msgspec
+
+    def dumps(obj: Any, indent: bool) -> bytes:  # noqa: ANN401
+        encoded = msgspec.json.encode(obj)
+        if indent:
+            return msgspec.json.format(encoded, indent=4)
+        return encoded
+
+    return _JSONBackend(name="msgspec", loads=msgspec.json.decode, dumps=dumps)
+
+
+def _simdjson_backend() -> _JSONBackend:
+    import simdjson
+
+    # simdjson is only a parser, which is why serialization falls back to the standard library
+    return _JSONBackend(name="simdjson", loads=simdjson.loads, dumps=_stdlib_dumps)
+
+
+_BACKEND_FACTORIES: dict[str, Callable[[], _JSONBackend]] = {
+    "json": _stdlib_backend,
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "simdjson": _simdjson_backend,
+}
+
+_STDLIB_BACKEND = _stdlib_backend()
+
+
+class UnknownJSONBackendError(ValueError):
+    def __init__(self, name: str) -> None:
+        super().__init__(
+            f"'{name}' is not a supported JSON backend. "
+            f"Supported backends are 'auto', {', '.join(map(repr, _BACKEND_FACTORIES))}."
+        )
@@ -4,6 +4,7 @@
 
 from .bbox import Bbox
 from .camera import Camera
+from .columnar_annotations import ColumnarAnnotations
 from .cuboid import Cuboid
 from .frame import Frame
 from .frame_interval import FrameInterval
@@ -31,6 +32,7 @@ from .transform import Transform
 __all__ = [
     "Bbox",
     "Camera",
+    "ColumnarAnnotations",
     "Cuboid",
     "ElementDataPointer",
     "Frame",
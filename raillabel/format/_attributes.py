@@ -11,6 +11,9 @@ from raillabel.json_format import (
     JSONVecAttribute,
 )
 
+_ATTRIBUTE_TYPES = ("boolean", "num", "text", "vec")
+"Keys of the attribute types in JSONAttributes in the order of the fields."
+
 
 def _attributes_from_json(json: JSONAttributes | None) -> dict[str, float | bool | str | list]:
     """Parse the annotation attributes from json."""
@@ -48,26 +51,57 @@ def _attributes_to_json(attributes: dict[str, float | bool | str | list]) -> JSO
     vec_attributes = []
 
     for name, value in attributes.items():
-        if isinstance(value, bool):
+        attribute_type = _attribute_type(name, value)
+
+        if attribute_type == "boolean":
             boolean_attributes.append(JSONBooleanAttribute(name=name, val=value))
 
-        elif isinstance(value, (int, float)):
+        elif attribute_type == "num":
             num_attributes.append(JSONNumAttribute(name=name, val=value))
 
-        elif isinstance(value, str):
+        elif attribute_type == "text":
             text_attributes.append(JSONTextAttribute(name=name, val=value))
 
-        elif isinstance(value, list):
-            vec_attributes.append(JSONVecAttribute(name=name, val=value))
-
         else:
-            raise UnsupportedAttributeTypeError(name, value)
+            vec_attributes.append(JSONVecAttribute(name=name, val=value))
 
     return JSONAttributes(
         boolean=boolean_attributes, num=num_attributes, text=text_attributes, vec=vec_attributes
     )
 
 
+def _attribute_pointers(attributes: dict[str, float | bool | str | list]) -> dict[str, str]:
+    """Return the attribute types by name in the order of the exported attributes.
+
+    This is what object data pointers store about the attributes, which is why the values do not
+    need to be exported just to determine it.
+    """
+    attribute_types = {name: _attribute_type(name, value) for name, value in attributes.items()}
+    return {
+        name: attribute_type
+        for group in _ATTRIBUTE_TYPES
+        for name, attribute_type in attribute_types.items()
+        if attribute_type == group
+    }
+
+
+def _attribute_type(name: str, value: object) -> str:
+    """Return the key of the attribute in JSONAttributes."""
+    if isinstance(value, bool):
+        return "boolean"
+
+    if isinstance(value, (int, float)):
+        return "num"
+
+    if isinstance(value, str):
+        return "text"
+
+    if isinstance(value, list):
+        return "vec"
+
+    raise UnsupportedAttributeTypeError(name, value)
+
+
 class UnsupportedAttributeTypeError(TypeError):
     def __init__(self, attribute_name: str, attribute_value: object) -> None:
         super().__init__(
@@ -0,0 +1,128 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import abc
+import collections.abc
+from array import array
+from typing import Iterator, Sequence, TypeVar, overload
+
+from .point2d import Point2d
+from .point3d import Point3d
+
+_Point = TypeVar("_Point", Point2d, Point3d)
+
+
+class _PointSequence(Sequence[_Point]):
+    """Read-only sequence of points stored as flat float64 coordinates.
+
+    The points are only created once they are accessed, which saves the memory and time of
+    constructing one object per point for long polylines.
+    """
+
+    _DIMENSIONS: int
+
+    __slots__ = ("coordinates",)
+
+    def __init__(self, coordinates: array) -> None:
+        self.coordinates = coordinates
+
+    @abc.abstractmethod
+    def _point(self, index: int) -> _Point:
+        """Create the point at a (non-negative) index from the coordinates."""
+
+    def __len__(self) -> int:
+        return len(self.coordinates) // self._DIMENSIONS
+
+    @overload
+    def __getitem__(self, index: int) -> _Point: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_Point]: ...
+
+    def __getitem__(self, index: int | slice) -> _Point | list[_Point]:
+        if isinstance(index, slice):
+            return [self._point(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        return self._point(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _PointSequence):
+            return self._DIMENSIONS == other._DIMENSIONS and self.coordinates == other.coordinates
+        if isinstance(other, collections.abc.Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class _Point2dSequence(_PointSequence[Point2d]):
+    _DIMENSIONS = 2
+
+    __slots__ = ()
+
+    def _point(self, index: int) -> Point2d:
+        return Point2d(x=self.coordinates[2 * index], y=self.coordinates[2 * index + 1])
+
+
+class _Point3dSequence(_PointSequence[Point3d]):
+    _DIMENSIONS = 3
+
+    __slots__ = ()
+
+    def _point(self, index: int) -> Point3d:
+        return Point3d(
+            x=self.coordinates[3 * index],
+            y=self.coordinates[3 * index + 1],
+            z=self.coordinates[3 * index + 2],
+        )
+
+
+class _PointIdSequence(Sequence[int]):
+    """Read-only sequence of point ids stored in an array of unsigned integers.
+
+    In contrast to the array itself, it compares equal to lists with the same point ids.
+    """
+
+    __slots__ = ("point_ids",)
+
+    def __init__(self, point_ids: array) -> None:
+        self.point_ids = point_ids
+
+    def __len__(self) -> int:
+        return len(self.point_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            return self.point_ids[index].tolist()
+        return self.point_ids[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.point_ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _PointIdSequence):
+            return self.point_ids == other.point_ids
+        if isinstance(other, collections.abc.Sequence):
+            return list(self.point_ids) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.point_ids.tolist()!r})"
@@ -3,6 +3,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+from typing import Any, TypeVar, cast
+
+_T = TypeVar("_T")
+
 
 def _empty_list_to_none(collection: list | None) -> list | None:
     if collection is None:
@@ -14,3 +19,23 @@ def _empty_list_to_none(collection: list | None) -> list | None:
 
 def _flatten_list(list_of_tuples: list[tuple]) -> list:
     return [item for tup in list_of_tuples for item in tup]
+
+
+def _slotted(cls: type[_T]) -> type[_T]:
+    """Recreate a dataclass with __slots__ for its fields.
+
+    Instances of slotted classes do not carry a __dict__, which considerably reduces the memory
+    of scenes with many annotations and points. This is what dataclass(slots=True) does, which is
+    only available from Python 3.10 on.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cast("Any", cls)))
+
+    namespace = dict(cls.__dict__)
+    for name in (*field_names, "__dict__", "__weakref__"):
+        # the defaults of the fields are already part of __init__
+        namespace.pop(name, None)
+    namespace["__slots__"] = field_names
+    namespace["__qualname__"] = cls.__qualname__
+
+    metaclass: Any = type(cls)
+    return cast("type[_T]", metaclass(cls.__name__, cls.__bases__, namespace))
@@ -9,10 +9,12 @@ from uuid import UUID
 from raillabel.json_format import JSONBbox
 
 from ._attributes import _attributes_from_json, _attributes_to_json
+from ._util import _slotted
 from .point2d import Point2d
 from .size2d import Size2d
 
 
+@_slotted
 @dataclass
 class Bbox:
     """A 2D bounding box in an image."""
@@ -0,0 +1,219 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import ClassVar
+from uuid import UUID
+
+from ._point_sequence import _PointSequence
+from .bbox import Bbox
+from .cuboid import Cuboid
+from .frame import Frame
+from .point2d import Point2d
+from .point3d import Point3d
+from .poly2d import Poly2d
+from .poly3d import Poly3d
+from .quaternion import Quaternion
+from .seg3d import Seg3d
+from .size2d import Size2d
+from .size3d import Size3d
+
+
+@dataclass
+class ColumnarAnnotations:
+    """All annotations of a scene stored column by column instead of one object per annotation.
+
+    The annotation at index i is described by the i-th entry of every column. Object and sensor
+    ids are dictionary encoded, so the columns hold indices into objects and sensors. The
+    geometry of all annotations is stored in a single float array, where the values of
+    annotation i are geometry[geometry_offsets[i]:geometry_offsets[i + 1]]:
+
+    - bbox: x, y, width, height
+    - cuboid: x, y, z of the position, x, y, z, w of the quaternion, x, y, z of the size
+    - poly2d: x, y of every point
+    - poly3d: x, y, z of every point
+    - seg3d: the point ids
+
+    The columns are typed arrays from the standard library with a fixed item size on every
+    platform, which support the buffer protocol. Libraries like numpy can therefore use them
+    without copying for vectorized operations. The UIDs are stored with a fixed width of 16 bytes
+    in a bytearray, which numpy reads with the dtype "V16". uid() converts them back to UUIDs.
+
+    Example:
+
+    .. code-block:: python
+
+        import numpy as np
+        import raillabel
+
+        annotations = raillabel.load("path/to/scene.json").to_columnar()
+
+        types = np.frombuffer(annotations.types, dtype=np.int8)
+        bbox_count = np.count_nonzero(types == annotations.ANNOTATION_TYPES.index("bbox"))
+    """
+
+    ANNOTATION_TYPES: ClassVar[tuple[str, ...]] = ("bbox", "cuboid", "poly2d", "poly3d", "seg3d")
+    "Names of the annotation types in the order of their codes in types."
+
+    frame_ids: array = field(default_factory=lambda: array("q"))
+    "Id of the frame of each annotation (int64)."
+
+    uids: bytearray = field(default_factory=bytearray)
+    "UID of each annotation as the 16 bytes of UUID.bytes one after another."
+
+    types: array = field(default_factory=lambda: array("b"))
+    "Type of each annotation as an index into ANNOTATION_TYPES (int8)."
+
+    object_ids: array = field(default_factory=lambda: array("i"))
+    "Object of each annotation as an index into objects (int32)."
+
+    sensor_ids: array = field(default_factory=lambda: array("i"))
+    "Sensor of each annotation as an index into sensors (int32)."
+
+    closed: array = field(default_factory=lambda: array("b"))
+    "1 for closed polylines (polygons) and 0 for everything else (int8)."
+
+    geometry: array = field(default_factory=lambda: array("d"))
+    "Geometry of all annotations one after another (float64)."
+
+    geometry_offsets: array = field(default_factory=lambda: array("q", [0]))
+    "Start of the geometry of each annotation followed by the end of the geometry (int64)."
+
+    attributes: list[dict[str, float | bool | str | list]] = field(default_factory=list)
+    "Attributes of each annotation."
+
+    objects: list[UUID] = field(default_factory=list)
+    "The object ids referenced by object_ids."
+
+    sensors: list[str] = field(default_factory=list)
+    "The sensor ids referenced by sensor_ids."
+
+    @classmethod
+    def from_frames(cls, frames: dict[int, Frame]) -> ColumnarAnnotations:
+        """Construct an instance of this class from the annotations of the frames."""
+        columns = cls()
+        object_codes: dict[UUID, int] = {}
+        sensor_codes: dict[str, int] = {}
+
+        for frame_id, frame in frames.items():
+            for uid, annotation in frame.annotations.items():
+                if annotation.object_id not in object_codes:
+                    object_codes[annotation.object_id] = len(columns.objects)
+                    columns.objects.append(annotation.object_id)
+                if annotation.sensor_id not in sensor_codes:
+                    sensor_codes[annotation.sensor_id] = len(columns.sensors)
+                    columns.sensors.append(annotation.sensor_id)
+
+                columns.frame_ids.append(frame_id)
+                columns.uids += uid.bytes
+                columns.object_ids.append(object_codes[annotation.object_id])
+                columns.sensor_ids.append(sensor_codes[annotation.sensor_id])
+                _append_geometry(columns, annotation)
+                columns.attributes.append(dict(annotation.attributes))
+
+        return columns
+
+    def __len__(self) -> int:
+        """Return the number of annotations."""
+        return len(self.types)
+
+    def uid(self, index: int) -> UUID:
+        """Return the UID of the annotation at the index."""
+        return UUID(bytes=bytes(self.uids[16 * index : 16 * (index + 1)]))
+
+    def annotation(self, index: int) -> Bbox | Cuboid | Poly2d | Poly3d | Seg3d:
+        """Construct the annotation at the index."""
+        annotation_type = self.ANNOTATION_TYPES[self.types[index]]
+        values = self.geometry[self.geometry_offsets[index] : self.geometry_offsets[index + 1]]
+        object_id = self.objects[self.object_ids[index]]
+        sensor_id = self.sensors[self.sensor_ids[index]]
+        attributes = dict(self.attributes[index])
+
+        if annotation_type == "bbox":
+            return Bbox(
+                pos=Point2d(values[0], values[1]),
+                size=Size2d(values[2], values[3]),
+                object_id=object_id,
+                sensor_id=sensor_id,
+                attributes=attributes,
+            )
+
+        if annotation_type == "cuboid":
+            return Cuboid(
+                pos=Point3d(values[0], values[1], values[2]),
+                quat=Quaternion(values[3], values[4], values[5], values[6]),
+                size=Size3d(values[7], values[8], values[9]),
+                object_id=object_id,
+                sensor_id=sensor_id,
+                attributes=attributes,
+            )
+
+        if annotation_type == "poly2d":
+            return Poly2d(
+                points=[Point2d(values[i], values[i + 1]) for i in range(0, len(values), 2)],
+                closed=bool(self.closed[index]),
+                object_id=object_id,
+                sensor_id=sensor_id,
+                attributes=attributes,
+            )
+
+        if annotation_type == "poly3d":
+            return Poly3d(
+                points=[
+                    Point3d(values[i], values[i + 1], values[i + 2])
+                    for i in range(0, len(values), 3)
+                ],
+                closed=bool(self.closed[index]),
+                object_id=object_id,
+                sensor_id=sensor_id,
+                attributes=attributes,
+            )
+
+        return Seg3d(
+            point_ids=[int(point_id) for point_id in values],
+            object_id=object_id,
+            sensor_id=sensor_id,
+            attributes=attributes,
+        )
+
+
+def _append_geometry(
+    columns: ColumnarAnnotations, annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d
+) -> None:
+    closed = False
+
+    if isinstance(annotation, Bbox):
+        columns.types.append(columns.ANNOTATION_TYPES.index("bbox"))
+        columns.geometry.extend(
+            (annotation.pos.x, annotation.pos.y, annotation.size.x, annotation.size.y)
+        )
+
+    elif isinstance(annotation, Cuboid):
+        columns.types.append(columns.ANNOTATION_TYPES.index("cuboid"))
+        columns.geometry.extend(
+            (*annotation.pos.to_json(), *annotation.quat.to_json(), *annotation.size.to_json())
+        )
+
+    elif isinstance(annotation, (Poly2d, Poly3d)):
+        columns.types.append(
+            columns.ANNOTATION_TYPES.index("poly2d" if isinstance(annotation, Poly2d) else "poly3d")
+        )
+        columns.geometry.extend(_point_coordinates(annotation.points))
+        closed = annotation.closed
+
+    else:
+        columns.types.append(columns.ANNOTATION_TYPES.index("seg3d"))
+        columns.geometry.fromlist(list(annotation.point_ids))
+
+    columns.closed.append(closed)
+    columns.geometry_offsets.append(len(columns.geometry))
+
+
+def _point_coordinates(points: list[Point2d] | list[Point3d]) -> array:
+    if isinstance(points, _PointSequence):
+        # the coordinates are already stored in a typed array
+        return points.coordinates
+    return array("d", [coordinate for point in points for coordinate in point.to_json()])
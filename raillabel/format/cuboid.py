@@ -9,11 +9,13 @@ from uuid import UUID
 from raillabel.json_format import JSONCuboid
 
 from ._attributes import _attributes_from_json, _attributes_to_json
+from ._util import _slotted
 from .point3d import Point3d
 from .quaternion import Quaternion
 from .size3d import Size3d
 
 
+@_slotted
 @dataclass
 class Cuboid:
     """3D bounding box."""
@@ -8,7 +8,10 @@ from uuid import UUID
 
 from raillabel.json_format import JSONNum
 
+from ._util import _slotted
 
+
+@_slotted
 @dataclass
 class Num:
     """A number."""
@@ -4,16 +4,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 from uuid import UUID
 
-from raillabel.json_format import JSONElementDataPointer, JSONFrameInterval, JSONObject
+from raillabel.json_format import JSONElementDataPointer, JSONObject
 
-from ._attributes import _attributes_to_json
+from ._attributes import _attribute_pointers
 from .frame_interval import FrameInterval
 
 if TYPE_CHECKING:
+    from .bbox import Bbox
+    from .cuboid import Cuboid
     from .frame import Frame
+    from .poly2d import Poly2d
+    from .poly3d import Poly3d
+    from .seg3d import Seg3d
+
+    _Annotation = Union[Bbox, Cuboid, Poly2d, Poly3d, Seg3d]
 
 
 @dataclass
@@ -37,68 +44,120 @@ class Object:
 
     def to_json(self, object_id: UUID, frames: dict[int, Frame]) -> JSONObject:
         """Export this object into the RailLabel JSON format."""
-        return JSONObject(
-            name=self.name,
-            type=self.type,
-            frame_intervals=_frame_intervals_to_json(object_id, frames),
-            object_data_pointers=_object_data_pointers_to_json(object_id, self.type, frames),
-        )
-
-
-def _frame_intervals_to_json(object_id: UUID, frames: dict[int, Frame]) -> list[JSONFrameInterval]:
-    frames_with_this_object = set()
-
-    for frame_id, frame in frames.items():
-        for annotation in frame.annotations.values():
-            if annotation.object_id == object_id:
-                frames_with_this_object.add(frame_id)
-                continue
-
-    return [fi.to_json() for fi in FrameInterval.from_frame_ids(list(frames_with_this_object))]
+        pointers = _ObjectPointers()
+        for frame_id, frame in frames.items():
+            for annotation in frame.annotations.values():
+                if annotation.object_id == object_id:
+                    pointers.add_annotation(frame_id, annotation, self.type)
 
+        return pointers.object_to_json(object_id, self)
 
-def _object_data_pointers_to_json(
-    object_id: UUID, object_type: str, frames: dict[int, Frame]
-) -> dict[str, JSONElementDataPointer]:
-    pointers_raw = {}
 
-    for frame_id, frame in frames.items():
-        for annotation in [ann for ann in frame.annotations.values() if ann.object_id == object_id]:
-            annotation_name = annotation.name(object_type)
-            if annotation_name not in pointers_raw:
-                pointers_raw[annotation_name] = {
-                    "frame_intervals": set(),
-                    "type": annotation_name.split("__")[1],
-                    "attribute_pointers": {},
-                }
+class _ObjectPointers:
+    """Frame intervals and object data pointers of objects collected one frame at a time.
 
-            pointers_raw[annotation_name]["frame_intervals"].add(frame_id)  # type: ignore
-            json_attributes = _attributes_to_json(annotation.attributes)
+    A single pass over the frames collects the pointers of all objects at once, while exporting
+    each object with Object.to_json() would scan every frame once per object. It also allows for
+    exporting objects without keeping all frames in memory.
+    """
 
-            if json_attributes is None:
-                continue
-
-            for attribute in json_attributes.boolean:  # type: ignore
-                pointers_raw[annotation_name]["attribute_pointers"][attribute.name] = "boolean"  # type: ignore
-
-            for attribute in json_attributes.num:  # type: ignore
-                pointers_raw[annotation_name]["attribute_pointers"][attribute.name] = "num"  # type: ignore
-
-            for attribute in json_attributes.text:  # type: ignore
-                pointers_raw[annotation_name]["attribute_pointers"][attribute.name] = "text"  # type: ignore
+    @classmethod
+    def from_frames(cls, frames: dict[int, Frame], objects: dict[UUID, Object]) -> _ObjectPointers:
+        """Collect the pointers of all objects from the frames of a scene."""
+        pointers = cls()
+        for frame_id, frame in frames.items():
+            pointers.add_frame(frame_id, frame, objects)
+        return pointers
+
+    def __init__(self) -> None:
+        self._pointers: dict[UUID, dict[str, _PointerData]] = {}
+
+    def add_frame(self, frame_id: int, frame: Frame, objects: dict[UUID, Object]) -> None:
+        """Collect the pointers of all annotations in a frame."""
+        for annotation in frame.annotations.values():
+            self.add_annotation(frame_id, annotation, objects[annotation.object_id].type)
+
+    def add_annotation(self, frame_id: int, annotation: _Annotation, object_type: str) -> None:
+        """Collect the pointer of a single annotation."""
+        self.add_pointer(
+            frame_id,
+            annotation.object_id,
+            annotation.name(object_type),
+            _attribute_pointers(annotation.attributes),
+        )
 
-            for attribute in json_attributes.vec:  # type: ignore
-                pointers_raw[annotation_name]["attribute_pointers"][attribute.name] = "vec"  # type: ignore
+    def add_pointer(
+        self,
+        frame_id: int,
+        object_id: UUID,
+        annotation_name: str,
+        attribute_pointers: dict[str, str],
+    ) -> None:
+        """Collect the pointer of an annotation, whose name and attribute types are known."""
+        object_pointers = self._pointers.setdefault(object_id, {})
+
+        if annotation_name not in object_pointers:
+            object_pointers[annotation_name] = _PointerData(annotation_name.split("__")[1])
+
+        pointer = object_pointers[annotation_name]
+        pointer.frame_ids.add(frame_id)
+        pointer.attribute_pointers.update(attribute_pointers)
+
+    def add_json(self, object_id: UUID, json_pointers: dict[str, JSONElementDataPointer]) -> None:
+        """Collect the object data pointers of an object, that have been exported before."""
+        object_pointers = self._pointers.setdefault(object_id, {})
+
+        for annotation_name, json_pointer in json_pointers.items():
+            if annotation_name not in object_pointers:
+                object_pointers[annotation_name] = _PointerData(json_pointer.type)
+
+            pointer = object_pointers[annotation_name]
+            for interval in json_pointer.frame_intervals:
+                pointer.frame_ids.update(range(interval.frame_start, interval.frame_end + 1))
+            pointer.attribute_pointers.update(json_pointer.attribute_pointers)
+
+    def remove_frame(self, frame_id: int) -> None:
+        """Remove a frame from the pointers of all objects.
+
+        Pointers, that are not present in any frame afterwards, are removed as well. The attribute
+        pointers are kept, as it is unknown whether other frames contain the attributes.
+        """
+        for object_pointers in self._pointers.values():
+            for annotation_name in list(object_pointers):
+                pointer = object_pointers[annotation_name]
+                pointer.frame_ids.discard(frame_id)
+                if len(pointer.frame_ids) == 0:
+                    del object_pointers[annotation_name]
+
+    def object_to_json(self, object_id: UUID, obj: Object) -> JSONObject:
+        """Export an object including the pointers collected for it."""
+        object_pointers = self._pointers.get(object_id, {})
+
+        frames_with_this_object: set[int] = set()
+        for pointer in object_pointers.values():
+            frames_with_this_object.update(pointer.frame_ids)
 
-    object_data_pointers = {}
-    for annotation_name, object_data_pointer in pointers_raw.items():
-        object_data_pointers[annotation_name] = JSONElementDataPointer(
-            type=object_data_pointer["type"],
+        return JSONObject(
+            name=obj.name,
+            type=obj.type,
             frame_intervals=[
-                fi.to_json()
-                for fi in FrameInterval.from_frame_ids(list(object_data_pointer["frame_intervals"]))  # type: ignore
+                fi.to_json() for fi in FrameInterval.from_frame_ids(list(frames_with_this_object))
             ],
-            attribute_pointers=object_data_pointer["attribute_pointers"],
+            object_data_pointers={
+                annotation_name: JSONElementDataPointer(
+                    type=pointer.type,
+                    frame_intervals=[
+                        fi.to_json() for fi in FrameInterval.from_frame_ids(list(pointer.frame_ids))
+                    ],
+                    attribute_pointers=pointer.attribute_pointers,
+                )
+                for annotation_name, pointer in object_pointers.items()
+            },
         )
 
-    return object_data_pointers
+
+class _PointerData:
+    def __init__(self, annotation_type: str) -> None:
+        self.type = annotation_type
+        self.frame_ids: set[int] = set()
+        self.attribute_pointers: dict[str, str] = {}
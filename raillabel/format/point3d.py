@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ._util import _slotted
 
+
+@_slotted
 @dataclass
 class Point3d:
     """A point in the 3D space."""
@@ -9,10 +9,11 @@ from uuid import UUID
 from raillabel.json_format import JSONPoly2d
 
 from ._attributes import _attributes_from_json, _attributes_to_json
-from ._util import _flatten_list
+from ._util import _flatten_list, _slotted
 from .point2d import Point2d
 
 
+@_slotted
 @dataclass
 class Poly2d:
     """Sequence of 2D points. Can either be a polygon or polyline."""
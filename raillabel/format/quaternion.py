@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ._util import _slotted
 
+
+@_slotted
 @dataclass
 class Quaternion:
     """A rotation represented by a quaternion."""
@@ -21,13 +21,14 @@ from raillabel.json_format import (
 
 from .bbox import Bbox
 from .camera import Camera
+from .columnar_annotations import ColumnarAnnotations
 from .cuboid import Cuboid
 from .frame import Frame
 from .frame_interval import FrameInterval
 from .gps_imu import GpsImu
 from .lidar import Lidar
 from .metadata import Metadata
-from .object import Object
+from .object import Object, _ObjectPointers
 from .other_sensor import OtherSensor
 from .poly2d import Poly2d
 from .poly3d import Poly3d
@@ -80,6 +81,7 @@ class Scene:
 
     def to_json(self) -> JSONScene:
         """Export this scene into the RailLabel JSON format."""
+        object_pointers = _ObjectPointers.from_frames(self.frames, self.objects)
         return JSONScene(
             openlabel=JSONSceneContent(
                 metadata=self.metadata.to_json(),
@@ -88,7 +90,8 @@ class Scene:
                 },
                 coordinate_systems=_coordinate_systems_to_json(self.sensors),
                 objects={
-                    obj_id: obj.to_json(obj_id, self.frames) for obj_id, obj in self.objects.items()
+                    obj_id: object_pointers.object_to_json(obj_id, obj)
+                    for obj_id, obj in self.objects.items()
                 },
                 frames={
                     frame_id: frame.to_json(self.objects) for frame_id, frame in self.frames.items()
@@ -109,6 +112,15 @@ class Scene:
             annotations.update(frame.annotations)
         return annotations
 
+    def to_columnar(self) -> ColumnarAnnotations:
+        """Return every annotation in this scene stored column by column.
+
+        This is considerably more compact than the annotation objects and allows vectorized
+        counting, filtering and statistics over large numbers of annotations. See
+        raillabel.format.ColumnarAnnotations for the layout of the columns.
+        """
+        return ColumnarAnnotations.from_frames(self.frames)
+
     def filter(self, filters: list[_FilterAbc]) -> Scene:
         """Return a scene with annotations, sensors, objects and frames excluded.
 
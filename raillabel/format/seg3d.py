@@ -9,8 +9,10 @@ from uuid import UUID
 from raillabel.json_format import JSONVec
 
 from ._attributes import _attributes_from_json, _attributes_to_json
+from ._util import _slotted
 
 
+@_slotted
 @dataclass
 class Seg3d:
     """The 3D segmentation of a lidar pointcloud."""
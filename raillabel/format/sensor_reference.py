@@ -8,7 +8,10 @@ from decimal import Decimal
 
 from raillabel.json_format import JSONStreamSync, JSONStreamSyncProperties, JSONStreamSyncTimestamp
 
+from ._util import _slotted
 
+
+@_slotted
 @dataclass
 class SensorReference:
     """A reference to a sensor in a specific frame."""
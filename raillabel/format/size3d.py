@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ._util import _slotted
 
+
+@_slotted
 @dataclass
 class Size3d:
     """The 3D size of a cube."""
@@ -0,0 +1,141 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+from raillabel.format import Scene
+
+_ENTRY_SUFFIX = ".pickle"
+
+_UNREADABLE_ENTRY_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    TypeError,
+    ValueError,
+)
+"Errors caused by cache entries, that are corrupted or were written by another raillabel version."
+
+
+class _SceneCache:
+    """Directory of pickled scenes, which evicts the least recently used ones once it is full.
+
+    Entries are keyed by the path, size and modification time of the annotation file, so a
+    changed file is never served from the cache.
+    """
+
+    def __init__(self, directory: Path | str, max_size: int | None) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def key(self, path: Path | str, *options: object) -> str:
+        """Return the key of an annotation file loaded with the options."""
+        from raillabel import __version__
+
+        path = Path(path).resolve()
+        stat = path.stat()
+        fingerprint = (
+            str(path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            __version__,
+            tuple(_normalized(option) for option in options),
+        )
+        return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+    def get(self, key: str) -> Scene | None:
+        """Return the cached scene or None if there is no (readable) entry for the key."""
+        entry = self._entry_path(key)
+
+        try:
+            with entry.open("rb") as file:
+                scene = pickle.load(file)  # noqa: S301
+            os.utime(entry)  # marks the entry as recently used
+        except _UNREADABLE_ENTRY_ERRORS:
+            return None
+
+        if not isinstance(scene, Scene):
+            return None
+
+        return scene
+
+    def put(self, key: str, scene: Scene) -> None:
+        """Store the scene and evict the least recently used entries exceeding max_size."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Writing to a temporary file first ensures, that concurrent loads never read a partially
+        # written entry.
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(scene, file, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(file.name).replace(self._entry_path(key))
+
+        self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / (key + _ENTRY_SUFFIX)
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        entries = []
+        for entry in self.directory.glob("*" + _ENTRY_SUFFIX):
+            with contextlib.suppress(FileNotFoundError):
+                entries.append((entry.stat(), entry))
+
+        entries.sort(key=lambda stat_and_entry: stat_and_entry[0].st_mtime, reverse=True)
+
+        total_size = 0
+        for stat, entry in entries:
+            total_size += stat.st_size
+            if total_size > self.max_size:
+                with contextlib.suppress(FileNotFoundError):
+                    entry.unlink()
+
+
+def _unordered(collection: object) -> object:
+    """Return a collection, whose order does not matter, as a sorted tuple for cache keys."""
+    # ranges are already ordered and might be too long to be materialized
+    if isinstance(collection, Iterable) and not isinstance(collection, range):
+        return tuple(sorted(collection))
+    return collection
+
+
+def _normalized(option: object) -> object:
+    """Return an equivalent of the option, whose repr does not depend on the hash seed.
+
+    The order of sets and therefore their repr differs between processes, so the same options
+    would result in different keys.
+    """
+    if isinstance(option, (set, frozenset)):
+        return tuple(sorted((_normalized(item) for item in option), key=repr))
+
+    if isinstance(option, (list, tuple)):
+        return tuple(_normalized(item) for item in option)
+
+    if isinstance(option, dict):
+        return tuple((key, _normalized(value)) for key, value in option.items())
+
+    if dataclasses.is_dataclass(option) and not isinstance(option, type):
+        return (
+            type(option).__qualname__,
+            *(
+                (field.name, _normalized(getattr(option, field.name)))
+                for field in dataclasses.fields(option)
+            ),
+        )
+
+    return option
@@ -0,0 +1,107 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from raillabel._json_backend import _STDLIB_BACKEND, _JSONBackend
+from raillabel.format import Bbox, Cuboid, Frame, Poly2d, Poly3d, Scene, Seg3d
+from raillabel.json_format import JSONFrame, JSONScene
+
+from ._projection import _Projection
+from ._scanner import _Buffer, _SceneLayout
+from ._trusted import (
+    _annotations_from_trusted_json,
+    _frame_from_trusted_json,
+    _header_from_trusted_json,
+    _scene_from_trusted_json,
+)
+
+
+@dataclass
+class _Decoder:
+    """Conversion of raw JSON data into raillabel.format classes according to the load options."""
+
+    validate: bool = True
+    "If False, the scene is constructed without validating the JSON data."
+
+    json_backend: _JSONBackend = _STDLIB_BACKEND
+    "The library used for parsing JSON."
+
+    projection: _Projection = field(default_factory=_Projection)
+    "The parts of the scene, that are loaded."
+
+    typed_arrays: bool = False
+    "If True, polylines and 3d segmentations are decoded into typed arrays."
+
+    def scene(self, json_data: dict) -> Scene:
+        """Decode a whole scene from its parsed JSON data."""
+        if isinstance(json_data.get("openlabel"), dict):
+            self.projection.apply_to_content(json_data["openlabel"])
+
+        if not self.validate:
+            return _scene_from_trusted_json(json_data, self.typed_arrays)
+
+        json_scene = JSONScene(**json_data)
+        if self.typed_arrays:
+            # the raw data has been validated and is therefore safe to be decoded as trusted
+            return _scene_from_trusted_json(json_data, typed_arrays=True)
+
+        return Scene.from_json(json_scene)
+
+    def header(self, buffer: _Buffer, layout: _SceneLayout) -> Scene:
+        """Decode everything except the frames into a scene."""
+        json_data = self.header_json_data(buffer, layout)
+        self.projection.apply_to_content(json_data["openlabel"])
+
+        if not self.validate:
+            return _header_from_trusted_json(json_data["openlabel"])
+
+        return Scene.from_json(JSONScene(**json_data))
+
+    def header_json_data(self, buffer: _Buffer, layout: _SceneLayout) -> dict:
+        """Parse everything except the frames into raw JSON data."""
+        json_data = {
+            key: self.json_backend.loads(buffer[start:end])
+            for key, (start, end) in layout.root.items()
+        }
+        json_data["openlabel"] = {
+            key: self.json_backend.loads(buffer[start:end])
+            for key, (start, end) in layout.content.items()
+        }
+        return json_data
+
+    def frame(self, raw_frame: bytes) -> Frame:
+        """Decode a single frame from its JSON representation."""
+        json_frame = self.projection.apply_to_frame(self.json_backend.loads(raw_frame))
+
+        if not self.validate:
+            return _frame_from_trusted_json(json_frame, self.typed_arrays)
+
+        validated_frame = JSONFrame(**json_frame)
+        if self.typed_arrays:
+            return _frame_from_trusted_json(json_frame, typed_arrays=True)
+
+        return Frame.from_json(validated_frame)
+
+    def frame_without_annotations(self, json_frame: dict) -> Frame:
+        """Decode everything of a parsed frame except the annotations."""
+        json_frame_without_annotations = {**json_frame, "objects": None}
+
+        if not self.validate:
+            return _frame_from_trusted_json(json_frame_without_annotations)
+
+        return Frame.from_json(JSONFrame(**json_frame_without_annotations))
+
+    def annotations(self, json_frame: dict) -> dict[UUID, Bbox | Cuboid | Poly2d | Poly3d | Seg3d]:
+        """Decode the annotations of a parsed frame."""
+        if not self.validate:
+            return _annotations_from_trusted_json(json_frame.get("objects"), self.typed_arrays)
+
+        validated_frame = JSONFrame(objects=json_frame.get("objects"))
+        if self.typed_arrays:
+            return _annotations_from_trusted_json(json_frame.get("objects"), typed_arrays=True)
+
+        return Frame.from_json(validated_frame).annotations
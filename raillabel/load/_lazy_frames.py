@@ -0,0 +1,96 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, MutableMapping
+
+from raillabel.format import Frame
+
+from ._decode import _Decoder
+from ._scanner import _Buffer
+
+
+class _LazyFrames(MutableMapping[int, Frame]):
+    """Frames of a scene, that are only decoded once they are accessed.
+
+    Only the byte offsets of the frames are known on construction. A frame is decoded the first
+    time it is accessed. If max_cached_frames is set, only that many decoded frames are kept and
+    the least recently used frame is decoded again on its next access. In this case, changes made
+    to a frame that has been evicted from the cache are lost. Frames assigned via
+    frames[frame_id] = frame are never evicted.
+
+    If the buffer maps an annotation file directly, mapped_file is the status of that file. The
+    file must then not be overwritten in place as long as frames are read from it.
+    """
+
+    def __init__(
+        self,
+        buffer: _Buffer,
+        frame_spans: list[tuple[int, int, int]],
+        max_cached_frames: int | None = None,
+        decoder: _Decoder | None = None,
+        mapped_file: os.stat_result | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._mapped_file = mapped_file
+        self._decoder = decoder if decoder is not None else _Decoder()
+        self._entries: dict[int, tuple[int, int] | Frame] = {
+            frame_id: (start, end) for frame_id, start, end in frame_spans
+        }
+        self._cache: OrderedDict[int, Frame] = OrderedDict()
+        self._max_cached_frames = max_cached_frames
+
+    def reads_from(self, path: Path | str) -> bool:
+        """Return whether the frames are read from the file at the given path."""
+        if self._mapped_file is None:
+            return False
+
+        try:
+            return os.path.samestat(self._mapped_file, Path(path).stat())
+        except FileNotFoundError:
+            return False
+
+    def __getitem__(self, frame_id: int) -> Frame:
+        entry = self._entries[frame_id]
+        if isinstance(entry, Frame):
+            return entry
+
+        if frame_id in self._cache:
+            self._cache.move_to_end(frame_id)
+            return self._cache[frame_id]
+
+        frame = self._decoder.frame(self._buffer[entry[0] : entry[1]])
+
+        if self._max_cached_frames is None:
+            self._entries[frame_id] = frame
+            return frame
+
+        self._cache[frame_id] = frame
+        while len(self._cache) > self._max_cached_frames:
+            self._cache.popitem(last=False)
+
+        return frame
+
+    def __setitem__(self, frame_id: int, frame: Frame) -> None:
+        self._entries[frame_id] = frame
+        self._cache.pop(frame_id, None)
+
+    def __delitem__(self, frame_id: int) -> None:
+        del self._entries[frame_id]
+        self._cache.pop(frame_id, None)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._entries)})"
+
+    def __reduce__(self) -> tuple:
+        return (dict, (dict(self.items()),))
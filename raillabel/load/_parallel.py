@@ -0,0 +1,37 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from raillabel._executor import _executor
+from raillabel.format import Frame
+
+from ._decode import _Decoder
+from ._scanner import _Buffer
+
+_CHUNKS_PER_WORKER = 4
+
+
+def _decode_frames_in_parallel(
+    buffer: _Buffer,
+    frame_spans: list[tuple[int, int, int]],
+    decoder: _Decoder,
+    workers: int,
+) -> dict[int, Frame]:
+    """Decode the frames in chunks distributed over multiple workers."""
+    chunk_size = max(1, -(-len(frame_spans) // (workers * _CHUNKS_PER_WORKER)))
+    chunks = [
+        [(frame_id, buffer[start:end]) for frame_id, start, end in frame_spans[i : i + chunk_size]]
+        for i in range(0, len(frame_spans), chunk_size)
+    ]
+
+    frames: dict[int, Frame] = {}
+    with _executor(workers) as executor:
+        for decoded_chunk in executor.map(_decode_chunk, [decoder] * len(chunks), chunks):
+            frames.update(decoded_chunk)
+
+    return frames
+
+
+def _decode_chunk(decoder: _Decoder, chunk: list[tuple[int, bytes]]) -> list[tuple[int, Frame]]:
+    return [(frame_id, decoder.frame(raw_frame)) for frame_id, raw_frame in chunk]
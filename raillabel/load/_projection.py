@@ -0,0 +1,92 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Container, Literal
+
+_AnnotationType = Literal["bbox", "cuboid", "poly2d", "poly3d", "seg3d"]
+
+_ANNOTATION_TYPE_KEYS = {
+    "bbox": "bbox",
+    "cuboid": "cuboid",
+    "poly2d": "poly2d",
+    "poly3d": "poly3d",
+    "seg3d": "vec",
+}
+
+
+@dataclass
+class _Projection:
+    """The parts of a scene selected for loading. None selects everything."""
+
+    frame_ids: Container[int] | None = None
+    "Ids of the frames, that are loaded."
+
+    sensor_ids: Collection[str] | None = None
+    "Ids of the sensors, whose annotations and sensor references are loaded."
+
+    annotation_types: Collection[_AnnotationType] | None = None
+    "Types of the annotations, that are loaded."
+
+    def includes_frame(self, frame_id: int) -> bool:
+        """Return True if the frame with this id is selected."""
+        return self.frame_ids is None or frame_id in self.frame_ids
+
+    def apply_to_content(self, content: dict) -> None:
+        """Remove everything, that is not selected, from the raw 'openlabel' JSON data."""
+        if self.sensor_ids is not None and isinstance(content.get("streams"), dict):
+            content["streams"] = {
+                sensor_id: stream
+                for sensor_id, stream in content["streams"].items()
+                if sensor_id in self.sensor_ids
+            }
+
+        if isinstance(content.get("frames"), dict):
+            content["frames"] = {
+                frame_id: self.apply_to_frame(json_frame)
+                for frame_id, json_frame in content["frames"].items()
+                if self.includes_frame(int(frame_id))
+            }
+
+    def apply_to_frame(self, json_frame: dict) -> dict:
+        """Remove the sensor references and annotations, that are not selected, from a raw frame."""
+        if self.sensor_ids is None and self.annotation_types is None:
+            return json_frame
+
+        frame_properties = json_frame.get("frame_properties")
+        if self.sensor_ids is not None and isinstance(frame_properties, dict):
+            frame_properties["streams"] = _select_sensors(
+                frame_properties.get("streams"), self.sensor_ids
+            )
+
+        for object_data in (json_frame.get("objects") or {}).values():
+            if isinstance(object_data, dict) and isinstance(object_data.get("object_data"), dict):
+                self._apply_to_annotations(object_data["object_data"])
+
+        return json_frame
+
+    def _apply_to_annotations(self, json_annotations: dict) -> None:
+        for annotation_type, key in _ANNOTATION_TYPE_KEYS.items():
+            if self.annotation_types is not None and annotation_type not in self.annotation_types:
+                json_annotations.pop(key, None)
+                continue
+
+            if self.sensor_ids is not None and isinstance(json_annotations.get(key), list):
+                json_annotations[key] = [
+                    json_annotation
+                    for json_annotation in json_annotations[key]
+                    if json_annotation.get("coordinate_system") in self.sensor_ids
+                ]
+
+
+def _select_sensors(json_streams: dict | None, sensor_ids: Collection[str]) -> dict | None:
+    if json_streams is None:
+        return None
+
+    return {
+        sensor_id: sensor_ref
+        for sensor_id, sensor_ref in json_streams.items()
+        if sensor_id in sensor_ids
+    }
@@ -0,0 +1,186 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+import mmap
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Union
+
+_Buffer = Union[bytes, mmap.mmap]
+_ValueEnd = Callable[[str, int], int]
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb"[^,:}\]\s]+")
+
+_OPENERS = frozenset(b"{[")
+_QUOTE = ord('"')
+_MIN_WINDOW_SIZE = 1 << 16
+
+_UTF8_CONTINUATION_MASK = 0xC0
+_UTF8_CONTINUATION_BITS = 0x80
+
+_DECODER = json.JSONDecoder()
+
+
+@dataclass
+class _SceneLayout:
+    """Byte spans of the top level members of a RailLabel file."""
+
+    root: dict[str, tuple[int, int]] = field(default_factory=dict)
+    "Spans of the root level members except 'openlabel'."
+
+    content: dict[str, tuple[int, int]] = field(default_factory=dict)
+    "Spans of the members of 'openlabel' except 'frames'."
+
+    frames: list[tuple[int, int, int]] = field(default_factory=list)
+    "The frame ids with the start and end offset of the corresponding frame."
+
+    frames_span: tuple[int, int] | None = None
+    "Span of the 'frames' object itself or None if there is none."
+
+
+def _scan_scene(buffer: _Buffer) -> _SceneLayout:
+    """Locate the members of a RailLabel file without keeping any decoded data."""
+    layout = _SceneLayout()
+
+    def frames_end(key: str, start: int) -> int:
+        if key != "frames" or _char_at(buffer, start) != b"{":
+            return _value_end(buffer, start)
+
+        frames, end = _scan_object(buffer, start)
+        layout.frames = [
+            (int(frame_id), frame_start, frame_end) for frame_id, frame_start, frame_end in frames
+        ]
+        layout.frames_span = (start, end)
+        return end
+
+    def content_end(key: str, start: int) -> int:
+        if key != "openlabel" or _char_at(buffer, start) != b"{":
+            return _value_end(buffer, start)
+
+        content, end = _scan_object(buffer, start, frames_end)
+        layout.content = {
+            content_key: (content_start, content_end)
+            for content_key, content_start, content_end in content
+            if content_key != "frames" or _char_at(buffer, content_start) != b"{"
+        }
+        return end
+
+    root, _ = _scan_object(buffer, 0, content_end)
+    layout.root = {key: (start, end) for key, start, end in root if key != "openlabel"}
+
+    return layout
+
+
+def _scan_object(
+    buffer: _Buffer, start: int, value_end: _ValueEnd | None = None
+) -> tuple[list[tuple[str, int, int]], int]:
+    """Return the key and value span of every member of the JSON object at start and its end.
+
+    If value_end is provided, it is called with the key and the start of each member value and
+    must return the end of the value. This allows for descending into specific members.
+    """
+    members: list[tuple[str, int, int]] = []
+    pos = _skip_whitespace(buffer, start)
+    _expect(buffer, pos, b"{")
+    pos = _skip_whitespace(buffer, pos + 1)
+
+    if _char_at(buffer, pos) == b"}":
+        return members, pos + 1
+
+    window_size = _MIN_WINDOW_SIZE
+    while True:
+        key_match = _STRING.match(buffer, pos)
+        if key_match is None:
+            raise MalformedJSONError(pos, "expected a string key")
+        key = json.loads(key_match.group())
+
+        pos = _skip_whitespace(buffer, key_match.end())
+        _expect(buffer, pos, b":")
+        member_start = _skip_whitespace(buffer, pos + 1)
+
+        if value_end is None:
+            member_end = _value_end(buffer, member_start, window_size)
+            window_size = max(_MIN_WINDOW_SIZE, 2 * (member_end - member_start))
+        else:
+            member_end = value_end(key, member_start)
+
+        members.append((key, member_start, member_end))
+
+        pos = _skip_whitespace(buffer, member_end)
+        if _char_at(buffer, pos) == b"}":
+            return members, pos + 1
+        _expect(buffer, pos, b",")
+        pos = _skip_whitespace(buffer, pos + 1)
+
+
+def _value_end(buffer: _Buffer, start: int, window_size: int = _MIN_WINDOW_SIZE) -> int:
+    """Return the offset directly after the JSON value beginning at start."""
+    if start >= len(buffer):
+        raise MalformedJSONError(start, "unexpected end of data")
+
+    first_char = buffer[start]
+
+    if first_char == _QUOTE:
+        string_match = _STRING.match(buffer, start)
+        if string_match is None:
+            raise MalformedJSONError(start, "unterminated string")
+        return string_match.end()
+
+    if first_char not in _OPENERS:
+        scalar_match = _SCALAR.match(buffer, start)
+        if scalar_match is None:
+            raise MalformedJSONError(start, "expected a value")
+        return scalar_match.end()
+
+    return _container_end(buffer, start, window_size)
+
+
+def _container_end(buffer: _Buffer, start: int, window_size: int) -> int:
+    # Tracking the nesting of objects and arrays token by token in Python is slow, which is why
+    # the C implementation of the JSON decoder is used instead. It only operates on strings, so a
+    # window of the buffer is decoded, which is enlarged until it contains the whole value.
+    while True:
+        window_end = _char_boundary(buffer, min(len(buffer), start + window_size))
+        text = buffer[start:window_end].decode("utf-8")
+
+        try:
+            _, char_end = _DECODER.raw_decode(text)
+        except json.JSONDecodeError as e:
+            if window_end >= len(buffer):
+                raise MalformedJSONError(start, e.msg) from e
+            window_size *= 4
+            continue
+
+        if text.isascii():
+            return start + char_end
+        return start + len(text[:char_end].encode("utf-8"))
+
+
+def _char_boundary(buffer: _Buffer, pos: int) -> int:
+    """Move pos back to the start of the UTF-8 encoded character it points into."""
+    while 0 < pos < len(buffer) and buffer[pos] & _UTF8_CONTINUATION_MASK == _UTF8_CONTINUATION_BITS:
+        pos -= 1
+    return pos
+
+
+def _skip_whitespace(buffer: _Buffer, pos: int) -> int:
+    return _WHITESPACE.match(buffer, pos).end()  # type: ignore
+
+
+def _char_at(buffer: _Buffer, pos: int) -> bytes:
+    return bytes(buffer[pos : pos + 1])
+
+
+def _expect(buffer: _Buffer, pos: int, char: bytes) -> None:
+    if _char_at(buffer, pos) != char:
+        raise MalformedJSONError(pos, f"expected '{char.decode()}'")
+
+
+class MalformedJSONError(ValueError):
+    def __init__(self, pos: int, reason: str) -> None:
+        super().__init__(f"Malformed RailLabel JSON at byte {pos}: {reason}.")
@@ -0,0 +1,92 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+from raillabel._compression import (
+    _compression_from_magic_bytes,
+    _decompress,
+    _open_for_reading,
+    _read_bytes,
+)
+
+_DECOMPRESSION_CHUNK_SIZE = 2**20
+
+_Source = Union[Path, str, IO[bytes], IO[str], bytes]
+"A path to an annotation file, a readable file object or the content of an annotation file."
+
+
+def _read_source(source: _Source) -> bytes:
+    """Return the (decompressed) content of an annotation file."""
+    if isinstance(source, bytes):
+        return _decompress(source)
+
+    if isinstance(source, (str, os.PathLike)):
+        return _read_bytes(source)
+
+    content = source.read()
+    if isinstance(content, str):
+        return content.encode()
+    return _decompress(content)
+
+
+@contextmanager
+def _open_buffer(source: _Source) -> Iterator[mmap.mmap | bytes]:
+    """Provide the raw bytes of an annotation file without reading it into memory at once."""
+    buffer = _map_file(source)
+    try:
+        yield buffer
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def _map_file(source: _Source) -> mmap.mmap | bytes:
+    """Memory map an annotation file. The map stays valid after the file has been closed.
+
+    Compressed files are decompressed into a temporary file, which is memory mapped instead, so
+    their content is never held in memory as a whole either. File objects and content, that is
+    already in memory, are returned as bytes.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        return _read_source(source)
+
+    if not _compression_from_magic_bytes(source):
+        with Path(source).open("rb") as annotation_file:
+            return _map(annotation_file)
+
+    # the temporary file is deleted once it is closed and no longer mapped
+    with tempfile.TemporaryFile() as decompressed_file:
+        with _open_for_reading(source) as compressed_file:
+            shutil.copyfileobj(compressed_file, decompressed_file, _DECOMPRESSION_CHUNK_SIZE)
+        decompressed_file.flush()
+        return _map(decompressed_file)
+
+
+def _mapped_file_stat(source: _Source, buffer: mmap.mmap | bytes) -> os.stat_result | None:
+    """Return the status of the file, that _map_file() has mapped directly, if any.
+
+    Compressed files are decompressed into a temporary file, so they are not mapped directly.
+    """
+    if not isinstance(buffer, mmap.mmap) or not isinstance(source, (str, os.PathLike)):
+        return None
+
+    if _compression_from_magic_bytes(source):
+        return None
+
+    return Path(source).stat()
+
+
+def _map(file: IO[bytes]) -> mmap.mmap | bytes:
+    if os.fstat(file.fileno()).st_size == 0:
+        return b""
+
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,249 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from array import array
+from decimal import Decimal
+from uuid import UUID
+
+from raillabel.format import (
+    Bbox,
+    Cuboid,
+    Frame,
+    Metadata,
+    Num,
+    Object,
+    Point2d,
+    Point3d,
+    Poly2d,
+    Poly3d,
+    Quaternion,
+    Scene,
+    Seg3d,
+    SensorReference,
+    Size2d,
+    Size3d,
+)
+from raillabel.format._point_sequence import _Point2dSequence, _Point3dSequence, _PointIdSequence
+from raillabel.format.scene import _sensors_from_json
+from raillabel.json_format import JSONSceneContent
+
+
+def _scene_from_trusted_json(json_data: dict, typed_arrays: bool = False) -> Scene:
+    """Construct a scene from raw JSON data without validation.
+
+    This mirrors Scene.from_json(), but operates on the output of the JSON parser instead of the
+    raillabel.json_format models. The data is expected to be a valid RailLabel file, like the ones
+    written by raillabel.save().
+    """
+    content = json_data["openlabel"]
+    scene = _header_from_trusted_json(content)
+    scene.frames = {
+        int(frame_id): _frame_from_trusted_json(json_frame, typed_arrays)
+        for frame_id, json_frame in (content.get("frames") or {}).items()
+    }
+    return scene
+
+
+def _header_from_trusted_json(content: dict) -> Scene:
+    """Construct a scene without frames from the raw 'openlabel' content.
+
+    Metadata and sensors are small compared to the rest of a file and are therefore still parsed
+    via the raillabel.json_format models.
+    """
+    json_header = JSONSceneContent(
+        metadata=content["metadata"],
+        streams=content.get("streams"),
+        coordinate_systems=content.get("coordinate_systems"),
+    )
+    return Scene(
+        metadata=Metadata.from_json(json_header.metadata),
+        sensors=_sensors_from_json(json_header.streams, json_header.coordinate_systems),
+        objects=_objects_from_trusted_json(content.get("objects")),
+    )
+
+
+def _objects_from_trusted_json(json_objects: dict | None) -> dict[UUID, Object]:
+    if json_objects is None:
+        return {}
+
+    return {
+        UUID(obj_id): Object(name=json_obj["name"], type=json_obj["type"])
+        for obj_id, json_obj in json_objects.items()
+    }
+
+
+def _frame_from_trusted_json(json_frame: dict, typed_arrays: bool = False) -> Frame:
+    """Construct a frame from raw JSON data without validation.
+
+    If typed_arrays is True, the points of polylines and the point ids of 3d segmentations are
+    stored in typed arrays instead of lists of Python objects.
+    """
+    frame_properties = json_frame.get("frame_properties") or {}
+    return Frame(
+        timestamp=_decimal_or_none(frame_properties.get("timestamp")),
+        sensors={
+            sensor_id: SensorReference(
+                timestamp=Decimal(str(sensor_ref["stream_properties"]["sync"]["timestamp"])),
+                uri=sensor_ref.get("uri"),
+            )
+            for sensor_id, sensor_ref in (frame_properties.get("streams") or {}).items()
+        },
+        frame_data={
+            num["name"]: Num(
+                name=num["name"],
+                val=float(num["val"]),
+                id=_uuid_or_none(num.get("uid")),
+                sensor_id=num.get("coordinate_system"),
+            )
+            for num in (frame_properties.get("frame_data") or {}).get("num") or []
+        },
+        annotations=_annotations_from_trusted_json(json_frame.get("objects"), typed_arrays),
+    )
+
+
+def _annotations_from_trusted_json(
+    json_object_data: dict | None, typed_arrays: bool = False
+) -> dict[UUID, Bbox | Cuboid | Poly2d | Poly3d | Seg3d]:
+    if json_object_data is None:
+        return {}
+
+    annotations: dict[UUID, Bbox | Cuboid | Poly2d | Poly3d | Seg3d] = {}
+
+    for object_id_str, object_data in json_object_data.items():
+        object_id = UUID(object_id_str)
+        json_annotations = object_data["object_data"]
+
+        for json_bbox in json_annotations.get("bbox") or []:
+            annotations[_uid(json_bbox)] = _bbox(json_bbox, object_id)
+
+        for json_cuboid in json_annotations.get("cuboid") or []:
+            annotations[_uid(json_cuboid)] = _cuboid(json_cuboid, object_id)
+
+        for json_poly2d in json_annotations.get("poly2d") or []:
+            annotations[_uid(json_poly2d)] = _poly2d(json_poly2d, object_id, typed_arrays)
+
+        for json_poly3d in json_annotations.get("poly3d") or []:
+            annotations[_uid(json_poly3d)] = _poly3d(json_poly3d, object_id, typed_arrays)
+
+        for json_seg3d in json_annotations.get("vec") or []:
+            annotations[_uid(json_seg3d)] = _seg3d(json_seg3d, object_id, typed_arrays)
+
+    return annotations
+
+
+def _bbox(json: dict, object_id: UUID) -> Bbox:
+    val = json["val"]
+    return Bbox(
+        pos=Point2d(x=float(val[0]), y=float(val[1])),
+        size=Size2d(x=float(val[2]), y=float(val[3])),
+        object_id=object_id,
+        sensor_id=json["coordinate_system"],
+        attributes=_attributes_from_trusted_json(json.get("attributes")),
+    )
+
+
+def _cuboid(json: dict, object_id: UUID) -> Cuboid:
+    val = json["val"]
+    return Cuboid(
+        pos=Point3d(x=float(val[0]), y=float(val[1]), z=float(val[2])),
+        quat=Quaternion(x=float(val[3]), y=float(val[4]), z=float(val[5]), w=float(val[6])),
+        size=Size3d(x=float(val[7]), y=float(val[8]), z=float(val[9])),
+        object_id=object_id,
+        sensor_id=json["coordinate_system"],
+        attributes=_attributes_from_trusted_json(json.get("attributes")),
+    )
+
+
+def _poly2d(json: dict, object_id: UUID, typed_arrays: bool) -> Poly2d:
+    val = json["val"]
+    return Poly2d(
+        points=(
+            _Point2dSequence(array("d", val))  # type: ignore[arg-type]
+            if typed_arrays
+            else [Point2d(x=float(val[i]), y=float(val[i + 1])) for i in range(0, len(val), 2)]
+        ),
+        closed=json["closed"],
+        object_id=object_id,
+        sensor_id=json["coordinate_system"],
+        attributes=_attributes_from_trusted_json(json.get("attributes")),
+    )
+
+
+def _poly3d(json: dict, object_id: UUID, typed_arrays: bool) -> Poly3d:
+    val = json["val"]
+    return Poly3d(
+        points=(
+            _Point3dSequence(array("d", val))  # type: ignore[arg-type]
+            if typed_arrays
+            else [
+                Point3d(x=float(val[i]), y=float(val[i + 1]), z=float(val[i + 2]))
+                for i in range(0, len(val), 3)
+            ]
+        ),
+        closed=json["closed"],
+        object_id=object_id,
+        sensor_id=json["coordinate_system"],
+        attributes=_attributes_from_trusted_json(json.get("attributes")),
+    )
+
+
+def _seg3d(json: dict, object_id: UUID, typed_arrays: bool) -> Seg3d:
+    return Seg3d(
+        point_ids=(
+            _point_id_array(json["val"])  # type: ignore[arg-type]
+            if typed_arrays
+            else [int(point_id) for point_id in json["val"]]
+        ),
+        object_id=object_id,
+        sensor_id=json["coordinate_system"],
+        attributes=_attributes_from_trusted_json(json.get("attributes")),
+    )
+
+
+def _point_id_array(val: list) -> _PointIdSequence:
+    try:
+        return _PointIdSequence(array("I", val))
+    except TypeError:
+        # files written by raillabel.save() store the point ids as floats
+        return _PointIdSequence(array("I", map(int, val)))
+
+
+def _attributes_from_trusted_json(json: dict | None) -> dict[str, float | bool | str | list]:
+    if json is None:
+        return {}
+
+    attributes: dict[str, float | bool | str | list] = {}
+
+    for bool_attribute in json.get("boolean") or []:
+        attributes[bool_attribute["name"]] = bool_attribute["val"]
+
+    for num_attribute in json.get("num") or []:
+        attributes[num_attribute["name"]] = float(num_attribute["val"])
+
+    for text_attribute in json.get("text") or []:
+        attributes[text_attribute["name"]] = text_attribute["val"]
+
+    for vec_attribute in json.get("vec") or []:
+        attributes[vec_attribute["name"]] = [
+            value if isinstance(value, str) else float(value) for value in vec_attribute["val"]
+        ]
+
+    return attributes
+
+
+def _uid(json_annotation: dict) -> UUID:
+    return _uuid_or_none(json_annotation.get("uid"))  # type: ignore[return-value]
+
+
+def _decimal_or_none(value: str | float | None) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(str(value))
+
+
+def _uuid_or_none(value: str | None) -> UUID | None:
+    if value is None:
+        return None
+    return UUID(value)
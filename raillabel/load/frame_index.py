@@ -0,0 +1,207 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+from raillabel._json_backend import _STDLIB_BACKEND, _get_json_backend
+
+from ._scanner import _Buffer, _scan_scene, _SceneLayout
+from ._source import _open_buffer, _Source
+
+_INDEX_SUFFIX = ".idx"
+_INDEX_VERSION = 2
+
+
+@dataclass
+class FrameIndexEntry:
+    """Location and summary of a frame in an annotation file."""
+
+    offset: int
+    "Position of the first byte of the frame in the (decompressed) annotation file."
+
+    length: int
+    "Number of bytes of the frame."
+
+    timestamp: Decimal | None
+    "Timestamp of the frame, if it has one."
+
+    annotation_counts: dict[str, int]
+    "Number of annotations in the frame by sensor id."
+
+    object_ids: list[UUID]
+    "Ids of the objects, that are annotated in the frame."
+
+
+def write_frame_index(path: Path | str, json_backend: str | None = None) -> Path:
+    """Write a sidecar index of the frames next to an annotation file.
+
+    The index stores the location of every frame in the file along with a small summary of the
+    frame. raillabel.load() and raillabel.iter_frames() use it to go straight to the frames
+    instead of scanning the whole file, which makes loading single frames (like
+    raillabel.load(path, frames=[9000])) of long scenes considerably faster. The index is ignored
+    once the annotation file changes and needs to be written again in that case.
+
+    Args:
+        path: Path to the annotation file.
+        json_backend: The library used for parsing JSON. See raillabel.load() for details.
+
+    Returns:
+        The path of the index file, which is the path of the annotation file with an appended
+        '.idx'.
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        raillabel.write_frame_index("path/to/scene.json")
+        frame = raillabel.load("path/to/scene.json", frames=[9000]).frames[9000]
+    """
+    backend = _get_json_backend(json_backend) or _STDLIB_BACKEND
+
+    with _open_buffer(path) as buffer:
+        layout = _scan_scene(buffer)
+        frames = {
+            str(frame_id): _frame_summary(backend.loads(buffer[start:end]), start, end)
+            for frame_id, start, end in layout.frames
+        }
+
+    return _write_index(path, layout, frames)
+
+
+def read_frame_index(path: Path | str) -> dict[int, FrameIndexEntry]:
+    """Read the sidecar index written by raillabel.write_frame_index() for an annotation file.
+
+    This allows for sampling frames by their content without decoding them.
+
+    Args:
+        path: Path to the annotation file (not the index file).
+
+    Returns:
+        The entries of the index by frame id.
+
+    Raises:
+        FileNotFoundError: if there is no index for the annotation file.
+        StaleFrameIndexError: if the annotation file has changed since the index was written.
+    """
+    index = _read_index(path)
+    if index is None:
+        raise StaleFrameIndexError(_index_path(path))
+
+    return {
+        int(frame_id): FrameIndexEntry(
+            offset=entry["offset"],
+            length=entry["length"],
+            timestamp=Decimal(entry["timestamp"]) if entry["timestamp"] is not None else None,
+            annotation_counts=entry["annotation_counts"],
+            object_ids=[UUID(object_id) for object_id in entry["object_ids"]],
+        )
+        for frame_id, entry in index["frames"].items()
+    }
+
+
+def _scene_layout(buffer: _Buffer, source: _Source) -> _SceneLayout:
+    """Return the layout from the index of the annotation file or scan the buffer for it."""
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            index = _read_index(source)
+        except (OSError, ValueError, KeyError):
+            index = None
+
+        if index is not None:
+            return _layout_from_index(index)
+
+    return _scan_scene(buffer)
+
+
+def _layout_from_index(index: dict) -> _SceneLayout:
+    return _SceneLayout(
+        root={key: _span(span) for key, span in index["root"].items()},
+        content={key: _span(span) for key, span in index["content"].items()},
+        frames=[
+            (int(frame_id), entry["offset"], entry["offset"] + entry["length"])
+            for frame_id, entry in index["frames"].items()
+        ],
+        frames_span=_span(index["frames_span"]) if index["frames_span"] is not None else None,
+    )
+
+
+def _span(json_span: list[int]) -> tuple[int, int]:
+    # JSON has no tuples, so the spans are stored as lists
+    start, end = json_span
+    return start, end
+
+
+def _write_index(path: Path | str, layout: _SceneLayout, frames: dict[str, dict]) -> Path:
+    """Write the index of an annotation file from its layout and the summaries of its frames."""
+    stat = Path(path).stat()
+    index = {
+        "version": _INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "root": layout.root,
+        "content": layout.content,
+        "frames_span": layout.frames_span,
+        "frames": frames,
+    }
+
+    index_path = _index_path(path)
+    index_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    return index_path
+
+
+def _read_index(path: Path | str) -> dict | None:
+    """Return the index of an annotation file or None if the file has changed since."""
+    index = json.loads(_index_path(path).read_text(encoding="utf-8"))
+
+    stat = Path(path).stat()
+    if (
+        index.get("version") != _INDEX_VERSION
+        or index["size"] != stat.st_size
+        or index["mtime_ns"] != stat.st_mtime_ns
+    ):
+        return None
+
+    return index
+
+
+def _frame_summary(json_frame: dict, start: int, end: int) -> dict:
+    timestamp = (json_frame.get("frame_properties") or {}).get("timestamp")
+    objects = json_frame.get("objects") or {}
+
+    annotation_counts: dict[str, int] = {}
+    for object_data in objects.values():
+        for json_annotations in object_data["object_data"].values():
+            for json_annotation in json_annotations:
+                sensor_id = json_annotation["coordinate_system"]
+                annotation_counts[sensor_id] = annotation_counts.get(sensor_id, 0) + 1
+
+    return {
+        "offset": start,
+        "length": end - start,
+        "timestamp": str(timestamp) if timestamp is not None else None,
+        "annotation_counts": annotation_counts,
+        "object_ids": list(objects.keys()),
+    }
+
+
+def _index_path(path: Path | str) -> Path:
+    return Path(path).with_name(Path(path).name + _INDEX_SUFFIX)
+
+
+class StaleFrameIndexError(ValueError):
+    """Raised if a frame index is read after the annotation file has changed."""
+
+    def __init__(self, index_path: Path) -> None:
+        super().__init__(
+            f"The frame index {index_path} is outdated, as the annotation file has changed since "
+            "it was written. Please write it again with raillabel.write_frame_index()."
+        )
@@ -0,0 +1,46 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+from raillabel.format import Frame
+
+from .scene_reader import SceneReader
+
+
+def iter_frames(
+    path: Path | str,
+    validate: bool = True,
+    json_backend: str | None = None,
+    typed_arrays: bool = False,
+) -> Iterator[tuple[int, Frame]]:
+    """Iterate over the frames of an annotation file one at a time.
+
+    In contrast to raillabel.load(), the file is never decoded as a whole. Only the frame that is
+    currently yielded is held in memory, which keeps the memory footprint of very long scenes
+    constant. Compressed files are decompressed into a temporary file first, which takes disk
+    space instead of memory. The rest of the scene (metadata, sensors and objects) is decoded and
+    validated before the first frame is yielded. Use raillabel.SceneReader to access it as well.
+
+    Args:
+        path: Path to the annotation file.
+        validate: If False, the file content is not validated. See raillabel.load() for details.
+        json_backend: The library used for parsing JSON. See raillabel.load() for details.
+        typed_arrays: If True, polylines and 3d segmentations are decoded into typed arrays. See
+            raillabel.load() for details.
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        for frame_id, frame in raillabel.iter_frames("path/to/scene.json"):
+            for annotation in frame.annotations.values():
+                pass  # do something with the annotation here
+    """
+    with SceneReader(path, validate, json_backend, typed_arrays) as reader:
+        yield from reader
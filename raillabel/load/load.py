@@ -3,23 +3,341 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import IO, Any, Collection, Container
 
+from raillabel._json_backend import _STDLIB_BACKEND, _get_json_backend
+from raillabel.filter._filter_abc import _FilterAbc
 from raillabel.format import Scene
-from raillabel.json_format import JSONScene
+from raillabel.format.scene import (
+    _annotation_passes_all_filters,
+    _frame_passes_all_filters,
+    _get_used_objects,
+    _get_used_sensors,
+    _remove_unused_sensor_references,
+    _separate_filters,
+)
 
+from ._cache import _SceneCache, _unordered
+from ._decode import _Decoder
+from ._lazy_frames import _LazyFrames
+from ._parallel import _decode_frames_in_parallel
+from ._projection import _AnnotationType, _Projection
+from ._source import _map_file, _mapped_file_stat, _open_buffer, _read_source, _Source
+from .frame_index import _scene_layout
 
-def load(path: Path | str) -> Scene:
+
+def load(
+    path: Path | str | IO[bytes] | IO[str],
+    lazy: bool = False,
+    max_cached_frames: int | None = None,
+    validate: bool = True,
+    json_backend: str | None = None,
+    frames: Container[int] | None = None,
+    sensors: Collection[str] | None = None,
+    annotation_types: Collection[_AnnotationType] | None = None,
+    filters: list[_FilterAbc] | None = None,
+    workers: int | None = None,
+    cache_dir: Path | str | None = None,
+    max_cache_size: int | None = 2**30,
+    mmap: bool = False,
+    typed_arrays: bool = False,
+) -> Scene:
     """Load an annotation file as a scene.
 
+    Compressed files (gzip, xz, bz2 and zstd) are detected automatically and decompressed on the
+    fly. Reading zstd files requires the zstandard package.
+
+    Args:
+        path: Path to the annotation file or a readable file object (like a member of a tar
+            archive). File objects are read completely.
+        lazy: If True, the frames are only decoded once they are accessed. Everything else
+            (metadata, sensors and objects) is decoded right away. This is useful if only a few
+            frames of a scene are required. Uncompressed files are memory mapped, while
+            compressed files are decompressed into a temporary file, which is memory mapped
+            instead. File objects are read into memory.
+        max_cached_frames: Maximum number of decoded frames kept in memory in lazy mode. Evicted
+            frames are decoded again on their next access. None keeps every decoded frame.
+        validate: If False, the file content is not validated against the RailLabel JSON format
+            and the scene is constructed directly from the parsed JSON data, which is
+            considerably faster. Only use this for trusted files, like the ones written by
+            raillabel.save(). Invalid files lead to undefined behavior.
+        json_backend: The library used for parsing JSON. Can be "json" (standard library),
+            "orjson", "msgspec", "simdjson" or "auto", which selects the fastest installed one.
+            If None, the value of the RAILLABEL_JSON_BACKEND environment variable is used and
+            the standard library if that is not set either.
+        frames: Ids of the frames to load (like range(100, 201)). Other frames are skipped
+            without being parsed. If the file has an index written by
+            raillabel.write_frame_index(), the selected frames are read directly without
+            scanning the rest of the file. None loads all frames.
+        sensors: Ids of the sensors to load. Other sensors as well as their annotations and
+            sensor references are never constructed. None loads all sensors.
+        annotation_types: Types of the annotations to load. Annotations of other types are never
+            constructed. None loads all annotations.
+        filters: Filters from raillabel.filter, that are applied while loading. The result is the
+            same as of raillabel.load(path).filter(filters), but frames rejected by a frame
+            level filter are never converted and rejected annotations are discarded right away.
+            Frame level filters are evaluated before the annotations of the frame are decoded.
+            Can not be combined with lazy.
+        workers: Number of processes decoding the frames in parallel (threads on free-threaded
+            Python builds). This speeds up loading large scenes on multi-core machines. None or 1
+            decodes the frames in the calling process. Has no effect in lazy mode or with filters.
+        cache_dir: Directory for caching loaded scenes in a binary format. Subsequent loads of
+            the same unchanged file with the same arguments are served from the cache, which is
+            considerably faster than parsing the JSON again. Files are considered changed if
+            their size or modification time differ. Scenes from the cache are never lazy and caching
+            a lazily loaded scene decodes all of its frames. None disables caching.
+        max_cache_size: Maximum total size of the cache directory in bytes. The least recently
+            used scenes are removed once it is exceeded. None does not limit the size.
+        mmap: If True, the file is memory mapped and decoded one frame at a time instead of
+            being read and parsed as a whole. This considerably reduces the peak memory of
+            loading large files, while the result is the same. Compressed files are decompressed
+            into a temporary file, which is memory mapped instead. Has no effect for file
+            objects, whose content is always read into memory.
+        typed_arrays: If True, the points of Poly2d and Poly3d annotations are stored as flat
+            float coordinates in an array.array and the point ids of Seg3d annotations in an
+            array.array of unsigned integers, instead of one Python object per point or id.
+            This reduces the memory and loading time of scenes with long polylines and large
+            segmentations considerably. Both are exposed as read-only sequences, which compare
+            equal to lists with the same points or point ids, so the scene is equal to one loaded
+            without typed_arrays. As every access to the points creates a new Point2d or Point3d,
+            changing such a point has no effect. Assign a new list to the points of an annotation
+            to change them instead.
+
     Example:
 
     .. code-block:: python
 
         import raillabel
         scene = raillabel.load("path/to/scene.json")
+
+        # only the rgb_center bboxes of frames 100 to 200
+        scene = raillabel.load(
+            "path/to/scene.json",
+            frames=range(100, 201),
+            sensors=["rgb_center"],
+            annotation_types=["bbox"],
+        )
+    """
+    decoder = _Decoder(
+        validate=validate,
+        json_backend=_get_json_backend(json_backend) or _STDLIB_BACKEND,
+        projection=_Projection(frames, sensors, annotation_types),
+        typed_arrays=typed_arrays,
+    )
+
+    if lazy and filters is not None:
+        raise LazyFilteringError
+
+    if cache_dir is None or not isinstance(path, (str, os.PathLike)):
+        return _load(path, lazy, max_cached_frames, decoder, filters, workers, mmap)
+
+    cache = _SceneCache(cache_dir, max_cache_size)
+    key = cache.key(
+        path,
+        validate,
+        _unordered(frames),
+        _unordered(sensors),
+        _unordered(annotation_types),
+        filters,
+        typed_arrays,
+    )
+
+    scene = cache.get(key)
+    if scene is None:
+        scene = _load(path, lazy, max_cached_frames, decoder, filters, workers, mmap)
+        cache.put(key, scene)
+
+    return scene
+
+
+def loads(
+    data: bytes | str,
+    validate: bool = True,
+    json_backend: str | None = None,
+    frames: Container[int] | None = None,
+    sensors: Collection[str] | None = None,
+    annotation_types: Collection[_AnnotationType] | None = None,
+    filters: list[_FilterAbc] | None = None,
+    workers: int | None = None,
+    typed_arrays: bool = False,
+) -> Scene:
+    """Load a scene from the content of an annotation file.
+
+    Compressed content (gzip, xz, bz2 and zstd) is detected automatically and decompressed.
+
+    Args:
+        data: Content of the annotation file.
+        validate: If False, the content is not validated. See raillabel.load() for details.
+        json_backend: The library used for parsing JSON. See raillabel.load() for details.
+        frames: Ids of the frames to load. See raillabel.load() for details.
+        sensors: Ids of the sensors to load. See raillabel.load() for details.
+        annotation_types: Types of the annotations to load. See raillabel.load() for details.
+        filters: Filters from raillabel.filter, that are applied while loading. See
+            raillabel.load() for details.
+        workers: Number of processes decoding the frames in parallel. See raillabel.load() for
+            details.
+        typed_arrays: If True, polylines and 3d segmentations are decoded into typed arrays. See
+            raillabel.load() for details.
+
+    Example:
+
+    .. code-block:: python
+
+        import tarfile
+        import raillabel
+
+        with tarfile.open("path/to/shard.tar") as shard:
+            scene = raillabel.loads(shard.extractfile("scene.json").read())
     """
-    with Path(path).open() as annotation_file:
-        json_data = json.load(annotation_file)
-    return Scene.from_json(JSONScene(**json_data))
+    decoder = _Decoder(
+        validate=validate,
+        json_backend=_get_json_backend(json_backend) or _STDLIB_BACKEND,
+        projection=_Projection(frames, sensors, annotation_types),
+        typed_arrays=typed_arrays,
+    )
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    return _load(
+        data,
+        lazy=False,
+        max_cached_frames=None,
+        decoder=decoder,
+        filters=filters,
+        workers=workers,
+        mmap=False,
+    )
+
+
+async def aload(
+    path: Path | str | IO[bytes] | IO[str],
+    executor: Executor | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> Scene:
+    """Load an annotation file as a scene without blocking the event loop.
+
+    Reading and decoding the file is done by raillabel.load() in an executor. The default
+    executor of the event loop runs it in a thread, which still competes with the event loop for
+    the GIL while decoding. A ProcessPoolExecutor avoids this for large files at the cost of
+    transferring the scene between the processes.
+
+    Args:
+        path: Path to the annotation file or a readable file object. See raillabel.load() for
+            details.
+        executor: The executor running raillabel.load(). None uses the default executor of the
+            event loop.
+        **kwargs: Further arguments of raillabel.load().
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        async def handle_request(path):
+            scene = await raillabel.aload(path, validate=False)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(load, path, **kwargs))
+
+
+def _load(
+    source: _Source,
+    lazy: bool,
+    max_cached_frames: int | None,
+    decoder: _Decoder,
+    filters: list[_FilterAbc] | None,
+    workers: int | None,
+    mmap: bool,
+) -> Scene:
+    if lazy:
+        return _load_lazy(source, max_cached_frames, decoder)
+
+    if filters is not None:
+        return _load_filtered(source, decoder, filters)
+
+    if mmap or decoder.projection.frame_ids is not None or (workers is not None and workers > 1):
+        return _load_frame_by_frame(source, decoder, workers)
+
+    return decoder.scene(decoder.json_backend.loads(_read_source(source)))
+
+
+def _load_lazy(source: _Source, max_cached_frames: int | None, decoder: _Decoder) -> Scene:
+    buffer = _map_file(source)
+    layout = _scene_layout(buffer, source)
+
+    scene = decoder.header(buffer, layout)
+    scene.frames = _LazyFrames(  # type: ignore[assignment]
+        buffer,
+        [span for span in layout.frames if decoder.projection.includes_frame(span[0])],
+        max_cached_frames,
+        decoder,
+        _mapped_file_stat(source, buffer),
+    )
+    return scene
+
+
+def _load_frame_by_frame(source: _Source, decoder: _Decoder, workers: int | None) -> Scene:
+    with _open_buffer(source) as buffer:
+        layout = _scene_layout(buffer, source)
+        frame_spans = [span for span in layout.frames if decoder.projection.includes_frame(span[0])]
+
+        scene = decoder.header(buffer, layout)
+        if workers is not None and workers > 1:
+            scene.frames = _decode_frames_in_parallel(buffer, frame_spans, decoder, workers)
+        else:
+            scene.frames = {
+                frame_id: decoder.frame(buffer[start:end]) for frame_id, start, end in frame_spans
+            }
+
+    return scene
+
+
+def _load_filtered(source: _Source, decoder: _Decoder, filters: list[_FilterAbc]) -> Scene:
+    frame_filters, annotation_filters = _separate_filters(filters)
+
+    with _open_buffer(source) as buffer:
+        layout = _scene_layout(buffer, source)
+        scene = decoder.header(buffer, layout)
+
+        filtered_scene = Scene(metadata=scene.metadata)
+        for frame_id, start, end in layout.frames:
+            if not decoder.projection.includes_frame(frame_id):
+                continue
+
+            json_frame = decoder.json_backend.loads(buffer[start:end])
+            json_frame = decoder.projection.apply_to_frame(json_frame)
+
+            frame = decoder.frame_without_annotations(json_frame)
+            if not _frame_passes_all_filters(frame_id, frame, frame_filters):
+                continue
+
+            frame.annotations = {
+                annotation_id: annotation
+                for annotation_id, annotation in decoder.annotations(json_frame).items()
+                if _annotation_passes_all_filters(
+                    annotation_id, annotation, annotation_filters, scene
+                )
+            }
+            filtered_scene.frames[frame_id] = frame
+
+    filtered_scene.sensors = _get_used_sensors(scene, filtered_scene)
+    filtered_scene.objects = _get_used_objects(scene, filtered_scene)
+
+    return _remove_unused_sensor_references(filtered_scene)
+
+
+class LazyFilteringError(ValueError):
+    """Raised if filters are passed to raillabel.load() in lazy mode."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Filters can not be applied in lazy mode, as all frames need to be decoded to "
+            "determine the sensors and objects used by the filtered scene."
+        )
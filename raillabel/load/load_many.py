@@ -0,0 +1,116 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from raillabel.format import Scene
+
+from .load import load
+
+
+@dataclass
+class LoadResult:
+    """Outcome of loading a single file with raillabel.load_many()."""
+
+    path: Path | str
+    "Path of the annotation file."
+
+    scene: Scene | None
+    "The loaded scene or None if loading failed."
+
+    error: Exception | None
+    "The exception raised while loading or None if loading succeeded."
+
+    seconds: float
+    "Time it took to load the file in seconds. NaN if the worker process loading it crashed."
+
+
+def load_many(
+    paths: Iterable[Path | str],
+    workers: int | None = None,
+    ordered: bool = True,
+    **kwargs: Any,  # noqa: ANN401
+) -> Iterator[LoadResult]:
+    """Load multiple annotation files concurrently.
+
+    The files are loaded in a process pool. Failing files do not abort the batch, instead the
+    exception is reported in the corresponding result.
+
+    Args:
+        paths: Paths to the annotation files.
+        workers: Number of processes loading files. None uses the number of CPUs. 1 loads the
+            files one after another in the calling process.
+        ordered: If True, the results are yielded in the order of the paths. Otherwise, they are
+            yielded as soon as a file has been loaded.
+        **kwargs: Further arguments of raillabel.load(), which are used for every file.
+
+    Yields:
+        The result of every file, which contains the scene or the exception raised while loading
+        as well as the time it took.
+
+    Example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+        import raillabel
+
+        paths = sorted(Path("path/to/OSDaR23").glob("*/*_labels.json"))
+        for result in raillabel.load_many(paths, workers=8, ordered=False):
+            if result.error is not None:
+                print(f"{result.path} failed: {result.error}")
+                continue
+            print(f"{result.path} loaded in {result.seconds:.1f}s")
+    """
+    paths = list(paths)
+
+    if workers == 1:
+        for path in paths:
+            yield _timed_load(path, kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_timed_load_in_worker, path, kwargs): path for path in paths}
+        try:
+            for future in futures if ordered else as_completed(futures):
+                yield _result(future, futures[future])
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _result(future: Future[LoadResult], path: Path | str) -> LoadResult:
+    try:
+        return future.result()
+    except Exception as e:  # noqa: BLE001
+        # the worker process has crashed, which is why the time is unknown
+        return LoadResult(path, None, e, float("nan"))
+
+
+def _timed_load(path: Path | str, kwargs: dict[str, Any]) -> LoadResult:
+    start = time.perf_counter()
+    try:
+        scene = load(path, **kwargs)
+    except Exception as e:  # noqa: BLE001
+        return LoadResult(path, None, e, time.perf_counter() - start)
+    return LoadResult(path, scene, None, time.perf_counter() - start)
+
+
+def _timed_load_in_worker(path: Path | str, kwargs: dict[str, Any]) -> LoadResult:
+    result = _timed_load(path, kwargs)
+
+    # exceptions, that can not be unpickled in the main process, would hide the original error
+    if result.error is not None:
+        try:
+            pickle.loads(pickle.dumps(result.error))  # noqa: S301
+        except Exception:  # noqa: BLE001
+            result.error = RuntimeError(f"{type(result.error).__name__}: {result.error}")
+
+    return result
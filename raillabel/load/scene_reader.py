@@ -0,0 +1,111 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator
+
+from raillabel._json_backend import _STDLIB_BACKEND, _get_json_backend
+from raillabel.format import Frame
+
+from ._decode import _Decoder
+from ._source import _map_file
+from .frame_index import _scene_layout
+
+
+class SceneReader:
+    """Read a scene from a file one frame at a time.
+
+    This is the counterpart of raillabel.SceneWriter. Everything except the frames (metadata,
+    sensors and objects) is decoded and validated once the reader is opened and available as
+    scene, whose frames stay empty. The frames are decoded one at a time while iterating over the
+    reader, so only the frame that is currently processed is held in memory. raillabel.iter_frames()
+    is a shortcut for iterating over a reader, if the rest of the scene is not required.
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        with raillabel.SceneReader("path/to/scene.json") as reader:
+            for frame_id, frame in reader:
+                for annotation in frame.annotations.values():
+                    object_type = reader.scene.objects[annotation.object_id].type
+                    print(annotation.name(object_type))
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        validate: bool = True,
+        json_backend: str | None = None,
+        typed_arrays: bool = False,
+    ) -> None:
+        """Open the file and decode everything except the frames.
+
+        Args:
+            path: Path to the annotation file.
+            validate: If False, the file content is not validated. See raillabel.load() for
+                details.
+            json_backend: The library used for parsing JSON. See raillabel.load() for details.
+            typed_arrays: If True, polylines and 3d segmentations are decoded into typed arrays.
+                See raillabel.load() for details.
+        """
+        self._decoder = _Decoder(
+            validate=validate,
+            json_backend=_get_json_backend(json_backend) or _STDLIB_BACKEND,
+            typed_arrays=typed_arrays,
+        )
+
+        self._buffer = _map_file(path)
+        self._closed = False
+
+        try:
+            self._layout = _scene_layout(self._buffer, path)
+            self.scene = self._decoder.header(self._buffer, self._layout)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def frame_ids(self) -> list[int]:
+        """The ids of the frames in the order of the file."""
+        return [frame_id for frame_id, _, _ in self._layout.frames]
+
+    def __iter__(self) -> Iterator[tuple[int, Frame]]:
+        """Decode the frames one at a time in the order of the file."""
+        for frame_id, start, end in self._layout.frames:
+            if self._closed:
+                raise SceneReaderClosedError
+
+            yield frame_id, self._decoder.frame(self._buffer[start:end])
+
+    def close(self) -> None:
+        """Close the file. The scene stays available."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._closed = True
+
+    def __enter__(self) -> SceneReader:  # noqa: PYI034
+        """Return the reader itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the reader, which also happens if an exception has been raised."""
+        self.close()
+
+
+class SceneReaderClosedError(ValueError):
+    """Raised if frames are read after the SceneReader has been closed."""
+
+    def __init__(self) -> None:
+        super().__init__("Frames can not be read after the SceneReader has been closed.")
@@ -0,0 +1,71 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from io import BufferedIOBase
+from pathlib import Path
+from typing import Iterator
+
+from raillabel._compression import _compressing_writer
+
+
+@contextmanager
+def _open_atomically(path: Path | str, sync: bool = True) -> Iterator[BufferedIOBase]:
+    """Open a temporary sibling of the path for writing, which replaces the path once closed.
+
+    If sync is True, the data is flushed to the disk before the temporary file is renamed, so the
+    path either points to the previous or the complete new file even if the process or machine
+    crashes. If an exception is raised while writing, the temporary file is removed and the path
+    is untouched. The data is compressed according to the file extension of the path.
+    """
+    path = Path(path)
+    fd, temporary_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    temporary_path = Path(temporary_name)
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            compressor = _compressing_writer(file, path)
+            if compressor is None:
+                yield file
+            else:
+                with compressor:
+                    yield compressor
+
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+
+        temporary_path.chmod(_mode(path))
+        temporary_path.replace(path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+    if sync:
+        _fsync_directory(path.parent)
+
+
+def _mode(path: Path) -> int:
+    # mkstemp() creates files only readable by the owner, unlike regular writes
+    if path.exists():
+        return path.stat().st_mode & 0o777
+
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _fsync_directory(directory: Path) -> None:
+    # persists the rename itself, which is not supported on Windows
+    if os.name == "nt":
+        return
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
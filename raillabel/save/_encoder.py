@@ -0,0 +1,187 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable
+from uuid import UUID
+
+from raillabel.format import Bbox, Cuboid, Frame, Num, Object, Poly2d, Poly3d, Seg3d, SensorReference
+from raillabel.format._attributes import _ATTRIBUTE_TYPES, _attribute_type
+from raillabel.format._point_sequence import _PointSequence
+from raillabel.format.object import _ObjectPointers
+
+_JSONDict = Dict[str, Any]
+"JSON data made of dicts, lists, strings, floats and bools, that can be serialized directly."
+
+_ANNOTATION_KEYS = {Bbox: "bbox", Cuboid: "cuboid", Poly2d: "poly2d", Poly3d: "poly3d", Seg3d: "vec"}
+"Keys of the annotation types in raillabel.json_format.JSONAnnotations in the order of the fields."
+
+
+def _frame_to_dict(
+    frame: Frame,
+    objects: dict[UUID, Object],
+    pointers: _ObjectPointers | None = None,
+    frame_id: int = 0,
+) -> _JSONDict:
+    """Export a frame directly into JSON data without constructing raillabel.json_format models.
+
+    The data is equal to frame.to_json(objects).model_dump(mode="json", exclude_none=True) and
+    therefore serializes to identical JSON, but takes a fraction of the time and memory. If
+    pointers are given, the object data pointers of the annotations are collected in them under
+    frame_id, reusing the names and attributes exported anyway.
+    """
+    frame_properties: _JSONDict = {}
+    if frame.timestamp is not None:
+        frame_properties["timestamp"] = str(frame.timestamp)
+    frame_properties["streams"] = {
+        sensor_id: _sensor_reference_to_dict(sensor_ref)
+        for sensor_id, sensor_ref in frame.sensors.items()
+    }
+    frame_properties["frame_data"] = {
+        "num": [_num_to_dict(num) for num in frame.frame_data.values()]
+    }
+
+    json_frame: _JSONDict = {"frame_properties": frame_properties}
+    if len(frame.annotations) > 0:
+        json_frame["objects"] = _objects_to_dict(frame, objects, pointers, frame_id)
+
+    return json_frame
+
+
+def _sensor_reference_to_dict(sensor_ref: SensorReference) -> _JSONDict:
+    json_sensor_ref: _JSONDict = {
+        "stream_properties": {"sync": {"timestamp": str(sensor_ref.timestamp)}}
+    }
+    if sensor_ref.uri is not None:
+        json_sensor_ref["uri"] = sensor_ref.uri
+    return json_sensor_ref
+
+
+def _num_to_dict(num: Num) -> _JSONDict:
+    json_num: _JSONDict = {"name": num.name, "val": float(num.val)}
+    if num.sensor_id is not None:
+        json_num["coordinate_system"] = num.sensor_id
+    if num.id is not None:
+        json_num["uid"] = str(num.id)
+    return json_num
+
+
+def _objects_to_dict(
+    frame: Frame, objects: dict[UUID, Object], pointers: _ObjectPointers | None, frame_id: int
+) -> _JSONDict:
+    annotations_by_object: dict[str, dict[str, list[_JSONDict]]] = {}
+
+    for annotation_id, annotation in frame.annotations.items():
+        object_id = str(annotation.object_id)
+        if object_id not in annotations_by_object:
+            annotations_by_object[object_id] = {key: [] for key in _ANNOTATION_KEYS.values()}
+
+        json_annotation = _annotation_to_dict(
+            annotation_id, annotation, objects[annotation.object_id].type
+        )
+        annotations_by_object[object_id][_annotation_key(annotation)].append(json_annotation)
+
+        if pointers is not None:
+            pointers.add_pointer(
+                frame_id,
+                annotation.object_id,
+                json_annotation["name"],
+                _attribute_pointers_from_dict(json_annotation.get("attributes")),
+            )
+
+    return {
+        object_id: {
+            "object_data": {key: value for key, value in annotations.items() if len(value) > 0}
+        }
+        for object_id, annotations in annotations_by_object.items()
+    }
+
+
+def _annotation_key(annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d) -> str:
+    for annotation_type, key in _ANNOTATION_KEYS.items():
+        if isinstance(annotation, annotation_type):
+            return key
+    raise TypeError
+
+
+def _annotation_to_dict(
+    annotation_id: UUID,
+    annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d,
+    object_type: str,
+) -> _JSONDict:
+    json_annotation: _JSONDict = {"name": annotation.name(object_type)}
+
+    if isinstance(annotation, Bbox):
+        json_annotation["val"] = _floats((*annotation.pos.to_json(), *annotation.size.to_json()))
+
+    elif isinstance(annotation, Cuboid):
+        json_annotation["val"] = _floats(
+            (*annotation.pos.to_json(), *annotation.quat.to_json(), *annotation.size.to_json())
+        )
+
+    elif isinstance(annotation, Poly2d):
+        json_annotation["val"] = _point_coordinates(annotation.points, _float_or_str)
+        json_annotation["closed"] = annotation.closed
+        json_annotation["mode"] = "MODE_POLY2D_ABSOLUTE"
+
+    elif isinstance(annotation, Poly3d):
+        json_annotation["val"] = _point_coordinates(annotation.points, float)
+        json_annotation["closed"] = annotation.closed
+
+    else:
+        json_annotation["val"] = _floats(annotation.point_ids)
+
+    json_annotation["coordinate_system"] = annotation.sensor_id
+    json_annotation["uid"] = str(annotation_id)
+
+    if len(annotation.attributes) > 0:
+        json_annotation["attributes"] = _attributes_to_dict(annotation.attributes)
+
+    return json_annotation
+
+
+def _attributes_to_dict(attributes: dict[str, float | bool | str | list]) -> _JSONDict:
+    json_attributes: _JSONDict = {attribute_type: [] for attribute_type in _ATTRIBUTE_TYPES}
+
+    for name, value in attributes.items():
+        attribute_type = _attribute_type(name, value)
+
+        json_value: Any = value
+        if attribute_type == "num":
+            json_value = float(json_value)
+        elif attribute_type == "vec":
+            json_value = [_float_or_str(v) for v in json_value]
+
+        json_attributes[attribute_type].append({"name": name, "val": json_value})
+
+    return json_attributes
+
+
+def _attribute_pointers_from_dict(json_attributes: _JSONDict | None) -> dict[str, str]:
+    if json_attributes is None:
+        return {}
+
+    return {
+        json_attribute["name"]: attribute_type
+        for attribute_type, group in json_attributes.items()
+        for json_attribute in group
+    }
+
+
+def _point_coordinates(points: Iterable, convert: Callable[[Any], float | str]) -> list:
+    if isinstance(points, _PointSequence):
+        # the coordinates are already stored as floats
+        return points.coordinates.tolist()
+    return [convert(coordinate) for point in points for coordinate in point.to_json()]
+
+
+def _floats(values: Iterable) -> list[float]:
+    return [float(value) for value in values]
+
+
+def _float_or_str(value: float | str) -> float | str:
+    # pydantic keeps strings in fields of the type float | str and converts anything else
+    if isinstance(value, str):
+        return value
+    return float(value)
@@ -0,0 +1,16 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from uuid import UUID
+
+
+class UnknownObjectError(ValueError):
+    """Raised if an annotation to be written belongs to an object, that is unknown."""
+
+    def __init__(self, annotation_id: UUID, object_id: UUID, hint: str) -> None:
+        super().__init__(
+            f"Annotation {annotation_id} belongs to the object {object_id}, which is unknown. "
+            + hint
+        )
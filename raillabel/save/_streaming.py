@@ -0,0 +1,317 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections import deque
+from concurrent.futures import Future
+from io import BufferedIOBase, BytesIO
+from typing import Iterable, Iterator, Union
+from uuid import UUID
+
+import pydantic_core
+from pydantic import BaseModel
+
+from raillabel._executor import _executor
+from raillabel._json_backend import _JSONBackend
+from raillabel.format import Frame, FrameInterval, Object, Scene
+from raillabel.format.object import _ObjectPointers
+from raillabel.format.scene import _coordinate_systems_to_json
+from raillabel.json_format import JSONObject
+
+from ._encoder import _frame_to_dict, _JSONDict
+
+_PYDANTIC_INDENTATION = 4
+
+_CHUNKS_PER_WORKER = 4
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+_FRAME_DEPTH = 3  # the frames are members of {"openlabel": {"frames": {...}}}
+
+_Value = Union[BaseModel, _JSONDict, "_Members", "_Items", "_Raw"]
+
+
+class _Members:
+    """Lazily generated members of a JSON object."""
+
+    def __init__(self, members: Iterable[tuple[str, _Value]]) -> None:
+        self._members = members
+
+    def __iter__(self) -> Iterator[tuple[str, _Value]]:
+        return iter(self._members)
+
+
+class _Items:
+    """Lazily generated items of a JSON array."""
+
+    def __init__(self, items: Iterable[_Value]) -> None:
+        self._items = items
+
+    def __iter__(self) -> Iterator[_Value]:
+        return iter(self._items)
+
+
+class _Raw:
+    """JSON data, that has been serialized beforehand at the position it is written to."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+
+class _StreamingWriter:
+    """Writes JSON to a file piece by piece instead of serializing it as a whole first.
+
+    The pieces are serialized with the same library and settings as a whole scene would be, so
+    the output is identical to serializing the scene at once.
+    """
+
+    def __init__(
+        self,
+        file: BufferedIOBase,
+        prettify_json: bool,
+        json_backend: _JSONBackend | None,
+        indentation: int | None = None,
+    ) -> None:
+        self.file = file
+        self.prettify_json = prettify_json
+        self.json_backend = json_backend
+
+        if not prettify_json:
+            self.indentation = None
+        elif json_backend is not None:
+            self.indentation = json_backend.indentation
+        else:
+            # only the pydantic serializer supports arbitrary indentations
+            self.indentation = indentation or _PYDANTIC_INDENTATION
+
+        self._colon = b":" if self.indentation is None else b": "
+        self._containers: list[bool] = []  # whether each open container is still empty
+
+    def write(self, value: _Value) -> None:
+        """Write a value at the current position."""
+        if isinstance(value, _Members):
+            self._open(b"{")
+            for key, member in value:
+                self.entry(member, key)
+            self.end(b"}")
+        elif isinstance(value, _Items):
+            self._open(b"[")
+            for item in value:
+                self.entry(item)
+            self.end(b"]")
+        elif isinstance(value, _Raw):
+            self.file.write(value.data)
+        else:
+            self.file.write(self.serialize(value, len(self._containers)))
+
+    def serialize(self, value: BaseModel | _JSONDict | list, depth: int) -> bytes:
+        """Serialize a value as it would be written inside depth open containers."""
+        return self._indent(self._dump(value), depth)
+
+    def serialize_member(self, key: str, value: BaseModel | _JSONDict, depth: int) -> bytes:
+        """Serialize a member of an object inside depth open containers, without the comma."""
+        return self._newline(depth) + self._key(key) + self.serialize(value, depth)
+
+    def begin(self, opening: bytes, key: str | None = None) -> None:
+        """Start a container (b"{" or b"[") inside the current container, which is kept open."""
+        self._separate(key)
+        self._open(opening)
+
+    def entry(self, value: _Value, key: str | None = None) -> None:
+        """Write a member (if key is given) or an item into the current container."""
+        self._separate(key)
+        self.write(value)
+
+    def end(self, closing: bytes) -> None:
+        """Close the current container with closing (b"}" or b"]")."""
+        is_empty = self._containers.pop()
+        if not is_empty:
+            self.file.write(self._newline(len(self._containers)))
+        self.file.write(closing)
+
+    def _open(self, opening: bytes) -> None:
+        self.file.write(opening)
+        self._containers.append(True)
+
+    def _separate(self, key: str | None) -> None:
+        if not self._containers:
+            return
+
+        if not self._containers[-1]:
+            self.file.write(b",")
+        self._containers[-1] = False
+        self.file.write(self._newline(len(self._containers)))
+
+        if key is not None:
+            self.file.write(self._key(key))
+
+    def _key(self, key: str) -> bytes:
+        return json.dumps(key, ensure_ascii=False).encode() + self._colon
+
+    def _dump(self, value: BaseModel | _JSONDict | list) -> bytes:
+        if self.json_backend is not None:
+            if isinstance(value, BaseModel):
+                value = value.model_dump(mode="json", exclude_none=True)
+            return self.json_backend.dumps(value, self.prettify_json)
+
+        if isinstance(value, BaseModel):
+            return value.model_dump_json(exclude_none=True, indent=self.indentation).encode()
+
+        # the same serializer as BaseModel.model_dump_json() uses
+        return pydantic_core.to_json(value, indent=self.indentation)
+
+    def _newline(self, depth: int) -> bytes:
+        if self.indentation is None:
+            return b""
+        return b"\n" + b" " * (self.indentation * depth)
+
+    def _indent(self, data: bytes, depth: int) -> bytes:
+        # JSON strings can not contain line breaks, so every line break is part of the formatting
+        if self.indentation is None or depth == 0:
+            return data
+        return data.replace(b"\n", self._newline(depth))
+
+
+def _write_scene(
+    scene: Scene,
+    file: BufferedIOBase,
+    prettify_json: bool,
+    json_backend: _JSONBackend | None,
+    workers: int | None = None,
+    compact: bool = False,
+) -> None:
+    """Write a scene to a file, while only holding the JSON data of a few frames at a time."""
+    writer = _StreamingWriter(file, prettify_json, json_backend)
+    writer.write(
+        _Members([("openlabel", _Members(_content_members(scene, writer, workers, compact)))])
+    )
+
+
+def _content_members(
+    scene: Scene, writer: _StreamingWriter, workers: int | None, compact: bool
+) -> Iterator[tuple[str, _Value]]:
+    # the order matches the fields of raillabel.json_format.JSONSceneContent
+    yield "metadata", scene.metadata.to_json()
+    yield "coordinate_systems", _Members(_coordinate_systems_to_json(scene.sensors).items())
+    yield (
+        "streams",
+        _Members((sensor_id, sensor.to_json()[0]) for sensor_id, sensor in scene.sensors.items()),
+    )
+    yield "objects", _Members(_object_members(scene, compact))
+
+    if workers is not None and workers > 1:
+        yield "frames", _Members(_serialize_frames_in_parallel(scene, writer, workers, compact))
+    else:
+        yield (
+            "frames",
+            _Members(
+                (str(frame_id), _frame_to_json(frame, scene.objects, compact))
+                for frame_id, frame in scene.frames.items()
+            ),
+        )
+
+    if compact:
+        return
+
+    yield (
+        "frame_intervals",
+        _Items(
+            frame_interval.to_json()
+            for frame_interval in FrameInterval.from_frame_ids(list(scene.frames.keys()))
+        ),
+    )
+
+
+def _object_members(scene: Scene, compact: bool) -> Iterator[tuple[str, JSONObject]]:
+    if compact:
+        # the frame intervals and object data pointers are derived from the frames when saving
+        for object_id, obj in scene.objects.items():
+            yield str(object_id), JSONObject(name=obj.name, type=obj.type)
+        return
+
+    object_pointers = _ObjectPointers.from_frames(scene.frames, scene.objects)
+    for object_id, obj in scene.objects.items():
+        yield str(object_id), object_pointers.object_to_json(object_id, obj)
+
+
+def _frame_to_json(frame: Frame, objects: dict[UUID, Object], compact: bool) -> _JSONDict:
+    json_frame = _frame_to_dict(frame, objects)
+    if not compact:
+        return json_frame
+
+    frame_properties = json_frame["frame_properties"]
+    if not frame_properties["streams"]:
+        del frame_properties["streams"]
+    if not frame_properties["frame_data"]["num"]:
+        del frame_properties["frame_data"]
+    if not frame_properties:
+        del json_frame["frame_properties"]
+
+    return json_frame
+
+
+def _serialize_frames_in_parallel(
+    scene: Scene, writer: _StreamingWriter, workers: int, compact: bool
+) -> Iterator[tuple[str, _Raw]]:
+    """Serialize the frames in chunks distributed over multiple workers.
+
+    The frames are yielded in their original order. Only a few chunks are serialized ahead of
+    the one being written, so the JSON data of the whole scene is never held in memory at once.
+    The frames are taken from the scene chunk by chunk, so lazily loaded frames are only decoded
+    shortly before they are serialized.
+    """
+    frames = iter(scene.frames.items())
+    chunk_size = max(1, -(-len(scene.frames) // (workers * _CHUNKS_PER_WORKER)))
+
+    with _executor(workers) as executor:
+        pending: deque[Future[list[tuple[str, bytes]]]] = deque()
+        while True:
+            chunk = list(itertools.islice(frames, chunk_size))
+            if not chunk:
+                break
+
+            pending.append(
+                executor.submit(
+                    _serialize_chunk,
+                    chunk,
+                    _used_objects(chunk, scene.objects),
+                    writer.prettify_json,
+                    writer.json_backend,
+                    compact,
+                )
+            )
+
+            if len(pending) > workers * _CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield from _raw_frames(pending.popleft())
+
+        while pending:
+            yield from _raw_frames(pending.popleft())
+
+
+def _used_objects(chunk: list[tuple[int, Frame]], objects: dict[UUID, Object]) -> dict[UUID, Object]:
+    # only the objects referenced in the chunk are transferred to the worker
+    return {
+        annotation.object_id: objects[annotation.object_id]
+        for _, frame in chunk
+        for annotation in frame.annotations.values()
+    }
+
+
+def _serialize_chunk(
+    chunk: list[tuple[int, Frame]],
+    objects: dict[UUID, Object],
+    prettify_json: bool,
+    json_backend: _JSONBackend | None,
+    compact: bool,
+) -> list[tuple[str, bytes]]:
+    writer = _StreamingWriter(BytesIO(), prettify_json, json_backend)
+    return [
+        (str(frame_id), writer.serialize(_frame_to_json(frame, objects, compact), _FRAME_DEPTH))
+        for frame_id, frame in chunk
+    ]
+
+
+def _raw_frames(future: Future[list[tuple[str, bytes]]]) -> Iterator[tuple[str, _Raw]]:
+    for frame_id, data in future.result():
+        yield frame_id, _Raw(data)
@@ -3,14 +3,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+from concurrent.futures import Executor
 from pathlib import Path
 
+from raillabel._compression import _open_for_writing
+from raillabel._json_backend import _get_json_backend
 from raillabel.format import Scene
+from raillabel.load._lazy_frames import _LazyFrames
 
+from ._atomic import _open_atomically
+from ._streaming import _write_scene
 
-def save(scene: Scene, path: Path | str, prettify_json: bool = False) -> None:
+
+def save(
+    scene: Scene,
+    path: Path | str,
+    prettify_json: bool = False,
+    json_backend: str | None = None,
+    workers: int | None = None,
+    atomic: bool = False,
+    compact: bool = False,
+) -> None:
     """Save a raillabel.Scene to a JSON file.
 
+    The file is written one frame at a time, so the JSON data of the whole scene is never held in
+    memory at once. If the path ends with .gz, .xz, .bz2 or .zst, the file is compressed
+    accordingly. Writing zstd files requires the zstandard package.
+
+    Args:
+        scene: The scene to save.
+        path: Path of the target file.
+        prettify_json: If True, the JSON is indented for better readability.
+        json_backend: The library used for serializing JSON. Can be "json" (standard library),
+            "orjson", "msgspec", "simdjson" (serializes via the standard library) or "auto",
+            which selects the fastest installed one. If None, the value of the
+            RAILLABEL_JSON_BACKEND environment variable is used and the pydantic serializer if
+            that is not set either. Note that orjson only supports an indentation of two spaces.
+        workers: Number of processes serializing the frames in parallel (threads on free-threaded
+            Python builds). This speeds up saving large scenes on multi-core machines. The output
+            is identical to serializing the frames one after another. None or 1 serializes the
+            frames in the calling process.
+        atomic: If True, the scene is written to a temporary file next to the target, which is
+            flushed to the disk and then renamed to the target. The target therefore either
+            contains the previous or the complete new scene, even if saving is interrupted by a
+            crash. The scene is still written one frame at a time. Otherwise, the target is
+            overwritten in place, unless the frames of a lazily loaded scene are still read from
+            it. In that case, the target is replaced by a temporary file as well, but without
+            flushing it to the disk first.
+        compact: If True, data that raillabel.load() does not need is omitted to reduce the file
+            size. These are the frame intervals and object data pointers of the objects, the
+            frame intervals of the scene as well as empty frame properties. The file is still
+            valid, but tools other than raillabel might rely on the omitted data.
+
     Example:
 
     .. code-block:: python
@@ -24,10 +70,59 @@ def save(scene: Scene, path: Path | str, prettify_json: bool = False) -> None:
         # or to get a human readable (but much larger) file
         raillabel.save(scene, "path/to/new_scene.json", prettify_json=True)
     """
-    if prettify_json:
-        json_data = scene.to_json().model_dump_json(exclude_none=True, indent=4)
+    backend = _get_json_backend(json_backend)
+
+    if atomic or _frames_are_read_from(scene, path):
+        with _open_atomically(path, sync=atomic) as scene_file:
+            _write_scene(scene, scene_file, prettify_json, backend, workers, compact)
     else:
-        json_data = scene.to_json().model_dump_json(exclude_none=True)
+        with _open_for_writing(path) as scene_file:
+            _write_scene(scene, scene_file, prettify_json, backend, workers, compact)
+
+
+def _frames_are_read_from(scene: Scene, path: Path | str) -> bool:
+    return isinstance(scene.frames, _LazyFrames) and scene.frames.reads_from(path)
+
+
+async def asave(
+    scene: Scene,
+    path: Path | str,
+    prettify_json: bool = False,
+    json_backend: str | None = None,
+    workers: int | None = None,
+    atomic: bool = False,
+    compact: bool = False,
+    executor: Executor | None = None,
+) -> None:
+    """Save a raillabel.Scene to a JSON file without blocking the event loop.
+
+    Serializing and writing the scene is done by raillabel.save() in an executor. The scene must
+    not be modified until the coroutine has finished.
 
-    with Path(path).open("w") as scene_file:
-        scene_file.write(json_data)
+    Args:
+        scene: The scene to save.
+        path: Path of the target file.
+        prettify_json: If True, the JSON is indented for better readability.
+        json_backend: The library used for serializing JSON. See raillabel.save() for details.
+        workers: Number of processes serializing the frames in parallel. See raillabel.save()
+            for details.
+        atomic: If True, the target is replaced atomically. See raillabel.save() for details.
+        compact: If True, data that can be derived when loading is omitted. See raillabel.save()
+            for details.
+        executor: The executor running raillabel.save(). None uses the default executor of the
+            event loop, which runs it in a thread.
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        async def handle_request(scene, path):
+            await raillabel.asave(scene, path)
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        executor,
+        functools.partial(save, scene, path, prettify_json, json_backend, workers, atomic, compact),
+    )
@@ -0,0 +1,188 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import TracebackType
+from uuid import UUID
+
+from raillabel._compression import _open_for_writing
+from raillabel._json_backend import _get_json_backend
+from raillabel.format import (
+    Camera,
+    Frame,
+    FrameInterval,
+    GpsImu,
+    Lidar,
+    Metadata,
+    Object,
+    OtherSensor,
+    Radar,
+)
+from raillabel.format.object import _ObjectPointers
+from raillabel.format.scene import _coordinate_systems_to_json
+
+from ._encoder import _frame_to_dict
+from ._errors import UnknownObjectError
+from ._streaming import _Items, _Members, _StreamingWriter
+
+
+class SceneWriter:
+    """Write a scene to a file one frame at a time.
+
+    In contrast to raillabel.save(), the scene is never held in memory as a whole. Every frame is
+    written as soon as it is passed to write_frame(), while the metadata, sensors, objects and
+    frame intervals are written once the writer is closed. The frame intervals and object data
+    pointers are collected from the frames on the fly.
+
+    Objects need to be added before the first frame with one of their annotations is written.
+    Sensors can be added at any time before closing.
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        with raillabel.SceneWriter("path/to/scene.json", metadata) as writer:
+            writer.add_sensor("rgb_center", camera)
+            writer.add_object(object_id, raillabel.format.Object(name="person_0001", type="person"))
+
+            for frame_id, frame in produce_frames():
+                writer.write_frame(frame_id, frame)
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        metadata: Metadata,
+        prettify_json: bool = False,
+        json_backend: str | None = None,
+    ) -> None:
+        """Open the file for writing.
+
+        Args:
+            path: Path of the target file. If it ends with .gz, .xz, .bz2 or .zst, the file is
+                compressed accordingly.
+            metadata: The metadata of the scene. Can be modified until the writer is closed.
+            prettify_json: If True, the JSON is indented for better readability.
+            json_backend: The library used for serializing JSON. See raillabel.save() for
+                details.
+        """
+        self.metadata = metadata
+        self.sensors: dict[str, Camera | Lidar | Radar | GpsImu | OtherSensor] = {}
+        self.objects: dict[UUID, Object] = {}
+
+        self._frame_ids: set[int] = set()
+        self._object_pointers = _ObjectPointers()
+
+        self._file = _open_for_writing(path)
+        self._writer = _StreamingWriter(self._file, prettify_json, _get_json_backend(json_backend))
+        self._writer.begin(b"{")
+        self._writer.begin(b"{", "openlabel")
+        self._writer.begin(b"{", "frames")
+
+    def add_sensor(
+        self, sensor_id: str, sensor: Camera | Lidar | Radar | GpsImu | OtherSensor
+    ) -> None:
+        """Add a sensor to the scene."""
+        self.sensors[sensor_id] = sensor
+
+    def add_object(self, object_id: UUID, obj: Object) -> None:
+        """Add an object to the scene, which can then be referenced by annotations."""
+        self.objects[object_id] = obj
+
+    def write_frame(self, frame_id: int, frame: Frame) -> None:
+        """Write a frame to the file. The frame is not referenced by the writer afterwards."""
+        if self._file.closed:
+            raise SceneWriterClosedError
+
+        if frame_id in self._frame_ids:
+            raise DuplicateFrameError(frame_id)
+
+        for annotation_id, annotation in frame.annotations.items():
+            if annotation.object_id not in self.objects:
+                raise UnknownObjectError(
+                    annotation_id,
+                    annotation.object_id,
+                    "Objects need to be added to the SceneWriter before their annotations are "
+                    "written.",
+                )
+
+        self._writer.entry(
+            _frame_to_dict(frame, self.objects, self._object_pointers, frame_id), str(frame_id)
+        )
+        self._frame_ids.add(frame_id)
+
+    def close(self) -> None:
+        """Write everything except the frames and close the file."""
+        if self._file.closed:
+            return
+
+        try:
+            self._writer.end(b"}")
+            self._writer.entry(self.metadata.to_json(), "metadata")
+            self._writer.entry(
+                _Members(_coordinate_systems_to_json(self.sensors).items()), "coordinate_systems"
+            )
+            self._writer.entry(
+                _Members(
+                    (sensor_id, sensor.to_json()[0]) for sensor_id, sensor in self.sensors.items()
+                ),
+                "streams",
+            )
+            self._writer.entry(
+                _Members(
+                    (str(object_id), self._object_pointers.object_to_json(object_id, obj))
+                    for object_id, obj in self.objects.items()
+                ),
+                "objects",
+            )
+            self._writer.entry(
+                _Items(
+                    frame_interval.to_json()
+                    for frame_interval in FrameInterval.from_frame_ids(list(self._frame_ids))
+                ),
+                "frame_intervals",
+            )
+            self._writer.end(b"}")
+            self._writer.end(b"}")
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> SceneWriter:  # noqa: PYI034
+        """Return the writer itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer.
+
+        If an exception has been raised, only the file is closed without writing the remaining
+        data. The file then ends after the last written frame, so it is not mistaken for a
+        complete scene.
+        """
+        if exc_type is not None:
+            self._file.close()
+            return
+
+        self.close()
+
+
+class SceneWriterClosedError(ValueError):
+    """Raised if a frame is written after the SceneWriter has been closed."""
+
+    def __init__(self) -> None:
+        super().__init__("Frames can not be written after the SceneWriter has been closed.")
+
+
+class DuplicateFrameError(ValueError):
+    """Raised if a frame id is written twice."""
+
+    def __init__(self, frame_id: int) -> None:
+        super().__init__(f"Frame {frame_id} has already been written.")
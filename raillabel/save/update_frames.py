@@ -0,0 +1,287 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+import re
+from io import BytesIO
+from pathlib import Path
+from typing import Tuple
+from uuid import UUID
+
+from raillabel.format import Frame, FrameInterval, Object
+from raillabel.format.object import _ObjectPointers
+from raillabel.json_format import JSONObject
+from raillabel.load._scanner import _Buffer, _scan_scene, _SceneLayout
+from raillabel.load._source import _open_buffer
+from raillabel.load.frame_index import (
+    _frame_summary,
+    _index_path,
+    _layout_from_index,
+    _read_index,
+    _scene_layout,
+    _write_index,
+    write_frame_index,
+)
+from raillabel.load.load import load
+
+from ._atomic import _open_atomically
+from ._encoder import _frame_to_dict, _JSONDict
+from ._errors import UnknownObjectError
+from ._streaming import _FRAME_DEPTH, _StreamingWriter
+from .save import save
+
+_CONTENT_DEPTH = 2  # the members of {"openlabel": {...}}
+_INDENTATION = re.compile(rb"\{\n( +)")
+
+_Patch = Tuple[int, int, bytes]
+"Replaces the bytes between the start and end offset of a file with the new bytes."
+
+
+def update_frames(
+    path: Path | str, frames: dict[int, Frame], objects: dict[UUID, Object] | None = None
+) -> None:
+    """Replace or add frames in an annotation file without loading and saving the whole scene.
+
+    Only the given frames, the objects and the frame intervals of the scene are serialized, while
+    everything else is copied from the file as is. The frame intervals and object data pointers of
+    the objects are updated accordingly, although attribute pointers are only ever added, since
+    removing them would require reading all frames. Like raillabel.save(..., atomic=True), the
+    file is replaced atomically. An index written by raillabel.write_frame_index() is updated as
+    well.
+
+    Args:
+        path: Path to the annotation file.
+        frames: The frames by their id. Frames with an id, that is already in the file, replace
+            the existing frame. The others are appended.
+        objects: Objects referenced by the annotations in the frames, that are not yet part of the
+            file. Objects, that are already part of the file, are not changed.
+
+    Raises:
+        UnknownObjectError: if an annotation belongs to an object, that is neither part of the file
+            nor of objects.
+
+    Example:
+
+    .. code-block:: python
+
+        import raillabel
+
+        frame = raillabel.load("path/to/scene.json", frames=[42]).frames[42]
+        # fix something about the frame
+        raillabel.update_frames("path/to/scene.json", {42: frame})
+    """
+    objects = objects or {}
+    index = _valid_index(path)
+
+    try:
+        json_frames = _patch(path, frames, objects, index)
+    except _UnpatchableFileError:
+        # without these members, there is nothing to patch and the file is small anyway
+        _rewrite(path, frames, objects)
+        return
+
+    if index is not None:
+        _update_index(path, index, json_frames)
+    elif _index_path(path).exists():
+        write_frame_index(path)
+
+
+def _patch(
+    path: Path | str, frames: dict[int, Frame], objects: dict[UUID, Object], index: dict | None
+) -> dict[int, _JSONDict]:
+    """Rewrite the file with the frames replaced or added and return their JSON data."""
+    with _open_atomically(path) as file, _open_buffer(path) as buffer:
+        layout = _layout_from_index(index) if index is not None else _scene_layout(buffer, path)
+        if layout.frames_span is None or "objects" not in layout.content:
+            raise _UnpatchableFileError
+
+        indentation = _indentation(buffer)
+        writer = _StreamingWriter(BytesIO(), indentation is not None, None, indentation)
+        json_objects = _read_objects(buffer, layout)
+        all_objects = {object_id: Object.from_json(obj) for object_id, obj in json_objects.items()}
+        for object_id, obj in objects.items():
+            all_objects.setdefault(object_id, obj)
+        _check_objects(frames, all_objects)
+
+        pointers = _pointers_without_frames(json_objects, frames, layout)
+        json_frames = {
+            frame_id: _frame_to_dict(frame, all_objects, pointers, frame_id)
+            for frame_id, frame in frames.items()
+        }
+        patches = [
+            *_frame_patches(json_frames, layout, writer),
+            _objects_patch(all_objects, pointers, layout, writer),
+        ]
+        if "frame_intervals" in layout.content:
+            patches.append(_frame_intervals_patch(json_frames, layout, writer))
+        patches.sort()
+
+        position = 0
+        for start, end, data in patches:
+            file.write(buffer[position:start])
+            file.write(data)
+            position = end
+        file.write(buffer[position:])
+
+    return json_frames
+
+
+def _valid_index(path: Path | str) -> dict | None:
+    try:
+        return _read_index(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _rewrite(path: Path | str, frames: dict[int, Frame], objects: dict[UUID, Object]) -> None:
+    scene = load(path)
+    for object_id, obj in objects.items():
+        scene.objects.setdefault(object_id, obj)
+    _check_objects(frames, scene.objects)
+    scene.frames.update(frames)
+    save(scene, path, prettify_json=_indentation(Path(path).read_bytes()) is not None, atomic=True)
+
+
+def _indentation(buffer: _Buffer) -> int | None:
+    match = _INDENTATION.match(buffer[:256])
+    if match is None:
+        return None
+    return len(match.group(1))
+
+
+def _read_objects(buffer: _Buffer, layout: _SceneLayout) -> dict[UUID, JSONObject]:
+    start, end = layout.content["objects"]
+    json_objects = json.loads(buffer[start:end]) or {}
+    return {UUID(object_id): JSONObject(**obj) for object_id, obj in json_objects.items()}
+
+
+def _check_objects(frames: dict[int, Frame], objects: dict[UUID, Object]) -> None:
+    for frame in frames.values():
+        for annotation_id, annotation in frame.annotations.items():
+            if annotation.object_id not in objects:
+                raise UnknownObjectError(
+                    annotation_id,
+                    annotation.object_id,
+                    "Objects need to be part of the annotation file or passed to update_frames().",
+                )
+
+
+def _frame_patches(
+    json_frames: dict[int, _JSONDict], layout: _SceneLayout, writer: _StreamingWriter
+) -> list[_Patch]:
+    frame_spans = {frame_id: (start, end) for frame_id, start, end in layout.frames}
+    patches = [
+        (*frame_spans[frame_id], writer.serialize(json_frame, _FRAME_DEPTH))
+        for frame_id, json_frame in json_frames.items()
+        if frame_id in frame_spans
+    ]
+
+    new_frames = {
+        str(frame_id): json_frame
+        for frame_id, json_frame in json_frames.items()
+        if frame_id not in frame_spans
+    }
+    if len(new_frames) == 0:
+        return patches
+
+    if len(layout.frames) == 0 and layout.frames_span is not None:
+        start, end = layout.frames_span
+        patches.append((start, end, writer.serialize(new_frames, _CONTENT_DEPTH)))
+        return patches
+
+    last_frame_end = layout.frames[-1][2]
+    appended_frames = b"".join(
+        b"," + writer.serialize_member(frame_id, json_frame, _FRAME_DEPTH)
+        for frame_id, json_frame in new_frames.items()
+    )
+    patches.append((last_frame_end, last_frame_end, appended_frames))
+    return patches
+
+
+def _pointers_without_frames(
+    json_objects: dict[UUID, JSONObject], frames: dict[int, Frame], layout: _SceneLayout
+) -> _ObjectPointers | None:
+    """Return the object data pointers of the file without the frames or None if it is compact."""
+    # objects alone can not tell, since a file might not have any objects yet
+    is_compact = "frame_intervals" not in layout.content and all(
+        obj.object_data_pointers is None for obj in json_objects.values()
+    )
+    if is_compact:
+        return None
+
+    pointers = _ObjectPointers()
+    for object_id, json_object in json_objects.items():
+        pointers.add_json(object_id, json_object.object_data_pointers or {})
+    for frame_id in frames:
+        pointers.remove_frame(frame_id)
+
+    return pointers
+
+
+def _objects_patch(
+    all_objects: dict[UUID, Object],
+    pointers: _ObjectPointers | None,
+    layout: _SceneLayout,
+    writer: _StreamingWriter,
+) -> _Patch:
+    if pointers is not None:
+        updated_objects = {
+            str(object_id): pointers.object_to_json(object_id, obj)
+            for object_id, obj in all_objects.items()
+        }
+    else:
+        updated_objects = {
+            str(object_id): JSONObject(name=obj.name, type=obj.type)
+            for object_id, obj in all_objects.items()
+        }
+
+    start, end = layout.content["objects"]
+    return (
+        start,
+        end,
+        writer.serialize(
+            {
+                object_id: obj.model_dump(mode="json", exclude_none=True)
+                for object_id, obj in updated_objects.items()
+            },
+            _CONTENT_DEPTH,
+        ),
+    )
+
+
+def _frame_intervals_patch(
+    json_frames: dict[int, _JSONDict], layout: _SceneLayout, writer: _StreamingWriter
+) -> _Patch:
+    frame_ids = {frame_id for frame_id, _, _ in layout.frames} | set(json_frames)
+    frame_intervals = [
+        frame_interval.to_json().model_dump(mode="json", exclude_none=True)
+        for frame_interval in FrameInterval.from_frame_ids(list(frame_ids))
+    ]
+
+    start, end = layout.content["frame_intervals"]
+    return start, end, writer.serialize(frame_intervals, _CONTENT_DEPTH)
+
+
+def _update_index(path: Path | str, index: dict, json_frames: dict[int, _JSONDict]) -> None:
+    # the offsets have changed, but only the summaries of the new frames need to be computed
+    with _open_buffer(path) as buffer:
+        layout = _scan_scene(buffer)
+
+    frames = {}
+    for frame_id, start, end in layout.frames:
+        if frame_id in json_frames:
+            frames[str(frame_id)] = _frame_summary(json_frames[frame_id], start, end)
+        else:
+            frames[str(frame_id)] = {
+                **index["frames"][str(frame_id)],
+                "offset": start,
+                "length": end - start,
+            }
+
+    _write_index(path, layout, frames)
+
+
+class _UnpatchableFileError(Exception):
+    """Raised if the file lacks the members, that are patched."""
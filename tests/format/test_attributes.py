@@ -13,6 +13,7 @@ from raillabel.json_format import (
     JSONVecAttribute,
 )
 from raillabel.format._attributes import (
+    _attribute_pointers,
     _attributes_from_json,
     _attributes_to_json,
     UnsupportedAttributeTypeError,
@@ -93,5 +94,21 @@ def test_attributes_to_json__unsupported_type():
         _attributes_to_json({"attribute_with_unsupported_type": object})
 
 
+def test_attribute_pointers():
+    actual = _attribute_pointers(
+        {"color_of_hat": "red", "number_of_red_clothing_items": 2, "has_red_hat": True}
+    )
+    assert list(actual.items()) == [
+        ("has_red_hat", "boolean"),
+        ("number_of_red_clothing_items", "num"),
+        ("color_of_hat", "text"),
+    ]
+
+
+def test_attribute_pointers__unsupported_type():
+    with pytest.raises(UnsupportedAttributeTypeError):
+        _attribute_pointers({"attribute_with_unsupported_type": object})
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
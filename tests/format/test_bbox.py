@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import pickle
+from copy import deepcopy
 from uuid import UUID
 
 import pytest
@@ -67,5 +69,18 @@ def test_to_json(bbox, bbox_json, bbox_id):
     assert actual == bbox_json
 
 
+def test_slots(bbox):
+    assert not hasattr(bbox, "__dict__")
+    assert not hasattr(bbox.pos, "__dict__")
+
+    with pytest.raises(AttributeError):
+        bbox.unknown_field = 42
+
+
+def test_copy(bbox):
+    assert pickle.loads(pickle.dumps(bbox)) == bbox
+    assert deepcopy(bbox) == bbox
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
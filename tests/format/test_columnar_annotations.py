@@ -0,0 +1,113 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+
+import raillabel
+from raillabel.format import ColumnarAnnotations
+from raillabel.load.load import load
+from raillabel.scene_builder import SceneBuilder
+
+
+def test_from_frames(bbox, cuboid, poly2d, poly3d, seg3d):
+    scene = (
+        SceneBuilder.empty()
+        .add_annotation(bbox, uid="1dbe924e-23f1-4313-9524-33ef9647160d", frame_id=1)
+        .add_annotation(cuboid, uid="cfebad9d-8fca-4a21-be7a-0555ff1fe4d2", frame_id=1)
+        .add_annotation(poly2d, uid="66137a24-634f-4d5f-837c-ebe9a53859b5", frame_id=2)
+        .add_annotation(poly3d, uid="9e8d3b1f-3c2a-4b5d-8e6f-7a1b2c3d4e5f", frame_id=2)
+        .add_annotation(seg3d, uid="4a5b6c7d-8e9f-4a0b-9c1d-2e3f4a5b6c7d", frame_id=3)
+        .result
+    )
+
+    actual = scene.to_columnar()
+    assert len(actual) == 5
+    assert list(actual.frame_ids) == [1, 1, 2, 2, 3]
+    assert actual.uid(0) == UUID("1dbe924e-23f1-4313-9524-33ef9647160d")
+    assert actual.uids[:16] == UUID("1dbe924e-23f1-4313-9524-33ef9647160d").bytes
+    assert [actual.ANNOTATION_TYPES[code] for code in actual.types] == [
+        "bbox",
+        "cuboid",
+        "poly2d",
+        "poly3d",
+        "seg3d",
+    ]
+    assert actual.objects[actual.object_ids[0]] == bbox.object_id
+    assert actual.sensors[actual.sensor_ids[0]] == bbox.sensor_id
+    assert list(actual.geometry[: actual.geometry_offsets[1]]) == [
+        bbox.pos.x,
+        bbox.pos.y,
+        bbox.size.x,
+        bbox.size.y,
+    ]
+    assert len(actual.geometry_offsets) == 6
+    assert actual.geometry_offsets[-1] == len(actual.geometry)
+
+    assert [actual.annotation(i) for i in range(len(actual))] == [
+        bbox,
+        cuboid,
+        poly2d,
+        poly3d,
+        seg3d,
+    ]
+
+
+def test_from_frames__empty():
+    actual = ColumnarAnnotations.from_frames({})
+    assert len(actual) == 0
+    assert list(actual.geometry_offsets) == [0]
+
+
+def test_item_sizes():
+    # the item sizes must not depend on the platform for numpy.frombuffer()
+    actual = ColumnarAnnotations()
+    assert actual.frame_ids.itemsize == 8
+    assert actual.types.itemsize == 1
+    assert actual.object_ids.itemsize == 4
+    assert actual.sensor_ids.itemsize == 4
+    assert actual.closed.itemsize == 1
+    assert actual.geometry.itemsize == 8
+    assert actual.geometry_offsets.itemsize == 8
+
+
+def test_from_frames__file(json_paths):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    annotations = [
+        (frame_id, uid, annotation)
+        for frame_id, frame in scene.frames.items()
+        for uid, annotation in frame.annotations.items()
+    ]
+
+    actual = scene.to_columnar()
+    assert len(actual) == len(annotations)
+    assert list(actual.frame_ids) == [frame_id for frame_id, _, _ in annotations]
+    assert len(actual.uids) == 16 * len(annotations)
+    assert [actual.uid(i) for i in range(len(actual))] == [uid for _, uid, _ in annotations]
+    assert [actual.annotation(i) for i in range(len(actual))] == [
+        annotation for _, _, annotation in annotations
+    ]
+
+
+def test_from_frames__typed_arrays(json_paths):
+    scene = load(json_paths["1_calibration_1.1_labels"], validate=False, typed_arrays=True)
+    assert (
+        scene.to_columnar() == raillabel.load(json_paths["1_calibration_1.1_labels"]).to_columnar()
+    )
+
+
+def test_from_frames__dictionary_encoding(json_paths):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+    actual = scene.to_columnar()
+    assert len(actual.objects) == len(set(actual.objects))
+    assert len(actual.sensors) == len(set(actual.sensors))
+    assert max(actual.object_ids) == len(actual.objects) - 1
+    assert max(actual.sensor_ids) == len(actual.sensors) - 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,85 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import copy
+import pickle
+from array import array
+
+import pytest
+
+from raillabel.format import Point2d, Point3d
+from raillabel.format._point_sequence import (
+    _Point2dSequence,
+    _Point3dSequence,
+    _PointIdSequence,
+    _PointSequence,
+)
+
+# == Tests ============================
+
+
+def test_point2d_sequence():
+    actual = _Point2dSequence(array("d", [1.5, 222, 1.7, 222.2]))
+    assert len(actual) == 2
+    assert actual[1] == Point2d(1.7, 222.2)
+    assert actual[-2] == Point2d(1.5, 222)
+    assert actual[1:] == [Point2d(1.7, 222.2)]
+    assert list(actual) == [Point2d(1.5, 222), Point2d(1.7, 222.2)]
+
+
+def test_point3d_sequence():
+    actual = _Point3dSequence(array("d", [1, 2, 3, 4, 5, 6]))
+    assert list(actual) == [Point3d(1, 2, 3), Point3d(4, 5, 6)]
+
+
+def test_abstract():
+    with pytest.raises(TypeError):
+        _PointSequence(array("d", [1, 2]))  # type: ignore[abstract]
+
+
+def test_index_error():
+    with pytest.raises(IndexError):
+        _Point2dSequence(array("d", [1, 2]))[1]
+
+
+def test_eq():
+    points = _Point2dSequence(array("d", [1, 2, 3, 4]))
+    assert points == [Point2d(1, 2), Point2d(3, 4)]
+    assert [Point2d(1, 2), Point2d(3, 4)] == points
+    assert points == _Point2dSequence(array("d", [1, 2, 3, 4]))
+    assert points != [Point2d(1, 2)]
+    assert points != _Point3dSequence(array("d", [1, 2, 3, 4, 5, 6]))
+
+
+def test_copy():
+    points = _Point3dSequence(array("d", [1, 2, 3]))
+    assert pickle.loads(pickle.dumps(points)) == points
+    assert copy.deepcopy(points) == points
+
+
+def test_point_id_sequence():
+    actual = _PointIdSequence(array("I", [4, 8, 15]))
+    assert len(actual) == 3
+    assert actual[-1] == 15
+    assert actual[1:] == [8, 15]
+    assert list(actual) == [4, 8, 15]
+
+
+def test_point_id_sequence__eq():
+    point_ids = _PointIdSequence(array("I", [4, 8, 15]))
+    assert point_ids == [4, 8, 15]
+    assert [4, 8, 15] == point_ids
+    assert point_ids == _PointIdSequence(array("I", [4, 8, 15]))
+    assert point_ids != [4, 8]
+
+
+def test_point_id_sequence__copy():
+    point_ids = _PointIdSequence(array("I", [4, 8, 15]))
+    assert pickle.loads(pickle.dumps(point_ids)) == point_ids
+    assert copy.deepcopy(point_ids) == point_ids
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
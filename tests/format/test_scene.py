@@ -6,6 +6,7 @@ from uuid import UUID
 
 import pytest
 
+import raillabel
 from raillabel.format import Scene
 from raillabel.scene_builder import SceneBuilder
 from raillabel.json_format import (
@@ -99,6 +100,15 @@ def test_to_json(scene, scene_json):
     assert actual == scene_json
 
 
+def test_to_json__objects_match_object_to_json(json_paths):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+
+    actual = scene.to_json().openlabel.objects
+    assert actual == {
+        object_id: obj.to_json(object_id, scene.frames) for object_id, obj in scene.objects.items()
+    }
+
+
 def test_annotations_with_frame_id(bbox, cuboid, poly2d):
     scene = (
         SceneBuilder.empty()
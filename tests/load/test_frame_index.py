@@ -0,0 +1,88 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import os
+import shutil
+from decimal import Decimal
+
+import pytest
+
+import raillabel
+from raillabel.load import frame_index
+from raillabel.load.frame_index import StaleFrameIndexError
+
+
+@pytest.fixture
+def indexed_path(json_paths, tmp_path):
+    path = tmp_path / "scene.json"
+    shutil.copy(json_paths["1_calibration_1.1_labels"], path)
+    raillabel.write_frame_index(path)
+    return path
+
+
+def test_write_frame_index(json_paths, tmp_path):
+    path = tmp_path / "scene.json"
+    shutil.copy(json_paths["openlabel_v1_short"], path)
+
+    actual = raillabel.write_frame_index(path)
+    assert actual == tmp_path / "scene.json.idx"
+    assert actual.exists()
+
+
+def test_read_frame_index(json_paths, tmp_path):
+    path = tmp_path / "scene.json"
+    shutil.copy(json_paths["openlabel_v1_short"], path)
+    raillabel.write_frame_index(path)
+    scene = raillabel.load(path)
+
+    actual = raillabel.read_frame_index(path)
+    assert list(actual.keys()) == [0, 1]
+    assert actual[0].timestamp == Decimal("1632321743.134149")
+    assert set(actual[0].object_ids) == {
+        annotation.object_id for annotation in scene.frames[0].annotations.values()
+    }
+    assert actual[0].annotation_counts == {
+        sensor_id: len(
+            [ann for ann in scene.frames[0].annotations.values() if ann.sensor_id == sensor_id]
+        )
+        for sensor_id in actual[0].annotation_counts
+    }
+    assert sum(actual[0].annotation_counts.values()) == len(scene.frames[0].annotations)
+
+    raw = path.read_bytes()
+    assert raw[actual[1].offset : actual[1].offset + actual[1].length].startswith(b"{")
+
+
+def test_read_frame_index__stale(indexed_path):
+    os.utime(indexed_path, ns=(0, 0))
+
+    with pytest.raises(StaleFrameIndexError):
+        raillabel.read_frame_index(indexed_path)
+
+
+def test_load__frame_index(json_paths, indexed_path, monkeypatch):
+    expected = raillabel.load(indexed_path, frames=[15])
+
+    def fail(_):
+        raise AssertionError
+
+    monkeypatch.setattr(frame_index, "_scan_scene", fail)
+
+    assert raillabel.load(indexed_path, frames=[15]) == expected
+
+    full_scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    assert raillabel.load(indexed_path, lazy=True) == full_scene
+    assert dict(raillabel.iter_frames(indexed_path)) == full_scene.frames
+
+
+def test_load__stale_frame_index(indexed_path):
+    indexed_path.write_text('{"openlabel": {"metadata": {"schema_version": "1.0.0"}}}')
+
+    actual = raillabel.load(indexed_path, frames=[15])
+    assert actual.frames == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
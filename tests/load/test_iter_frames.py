@@ -0,0 +1,82 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+import raillabel
+
+
+def test_iter_frames(json_paths):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+
+    actual = dict(raillabel.iter_frames(json_paths["openlabel_v1_short"]))
+    assert actual == scene.frames
+
+
+def test_iter_frames__compressed(json_paths, tmp_path):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, tmp_path / "scene.json.gz")
+
+    actual = dict(raillabel.iter_frames(tmp_path / "scene.json.gz"))
+    assert actual == scene.frames
+
+
+def test_iter_frames__order(json_paths):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+    actual = [
+        frame_id for frame_id, _ in raillabel.iter_frames(json_paths["1_calibration_1.1_labels"])
+    ]
+    assert actual == list(scene.frames.keys())
+
+
+def test_iter_frames__frames_before_metadata(json_data, tmp_path):
+    content = json_data["openlabel_v1_short"]["openlabel"]
+    reordered = {"openlabel": {"frames": content["frames"], **content}}
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(reordered, indent=2))
+
+    actual = dict(raillabel.iter_frames(path))
+    assert actual == raillabel.load(path).frames
+
+
+def test_iter_frames__brackets_and_unicode_in_strings(json_data, tmp_path):
+    content = json_data["openlabel_v1_short"]["openlabel"]
+    content["metadata"]["comment"] = '{"ü": [}'
+    for json_frame in content["frames"].values():
+        json_frame["frame_properties"]["streams"] = {
+            sensor_id: {**stream, "uri": '/ä/{[\\"]}.png'}
+            for sensor_id, stream in json_frame["frame_properties"]["streams"].items()
+        }
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(json_data["openlabel_v1_short"], ensure_ascii=False), "utf-8")
+
+    actual = dict(raillabel.iter_frames(path))
+    assert actual == raillabel.load(path).frames
+    assert actual[0].sensors["rgb_center"].uri == '/ä/{[\\"]}.png'
+
+
+def test_iter_frames__invalid_header(json_data, tmp_path):
+    json_data["openlabel_v1_short"]["openlabel"]["metadata"]["schema_version"] = "0.0.1"
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(json_data["openlabel_v1_short"]))
+
+    with pytest.raises(ValidationError):
+        next(raillabel.iter_frames(path))
+
+
+def test_iter_frames__malformed(tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text('{"openlabel": {"frames": {"1": {"objects": {}')
+
+    with pytest.raises(ValueError):
+        next(raillabel.iter_frames(path))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
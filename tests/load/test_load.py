@@ -3,9 +3,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import gzip
+import io
+import json
+import lzma
+import os
+import subprocess
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
 import pytest
 
 import raillabel
+from raillabel._json_backend import UnknownJSONBackendError
+from raillabel.format import Bbox, Frame, Poly2d, Poly3d, Seg3d
+from raillabel.format._point_sequence import _PointIdSequence, _PointSequence
+from raillabel.load.load import LazyFilteringError
+
+
+@pytest.fixture
+def frame_decoding_counter(monkeypatch) -> list[int]:
+    decoded_frames = [0]
+    original_from_json = Frame.from_json.__func__
+
+    def counting_from_json(cls, json):
+        decoded_frames[0] += 1
+        return original_from_json(cls, json)
+
+    monkeypatch.setattr(Frame, "from_json", classmethod(counting_from_json))
+    return decoded_frames
 
 
 def test_load(json_paths):
@@ -15,5 +45,346 @@ def test_load(json_paths):
     assert len(actual.frames) == 2
 
 
+def test_load__file_object(json_paths):
+    with json_paths["openlabel_v1_short"].open("rb") as annotation_file:
+        actual = raillabel.load(annotation_file)
+
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__text_file_object(json_paths):
+    with json_paths["openlabel_v1_short"].open() as annotation_file:
+        actual = raillabel.load(annotation_file, lazy=True)
+
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__compressed_file_object(json_paths):
+    compressed = gzip.compress(json_paths["openlabel_v1_short"].read_bytes())
+
+    actual = raillabel.load(io.BytesIO(compressed), frames=[1])
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"], frames=[1])
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load__mmap(json_paths, validate):
+    actual = raillabel.load(json_paths["1_calibration_1.1_labels"], mmap=True, validate=validate)
+    assert actual == raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+
+@pytest.mark.parametrize("as_text", [True, False])
+def test_loads(json_paths, as_text):
+    data = json_paths["openlabel_v1_short"].read_bytes()
+    if as_text:
+        data = data.decode()
+
+    actual = raillabel.loads(data)
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_loads__compressed(json_paths):
+    compressed = lzma.compress(json_paths["openlabel_v1_short"].read_bytes())
+
+    actual = raillabel.loads(compressed, validate=False, sensors=["lidar"])
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"], sensors=["lidar"])
+
+
+def test_aload(json_paths):
+    actual = asyncio.run(raillabel.aload(json_paths["openlabel_v1_short"], validate=False))
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_aload__process_pool(json_paths):
+    async def load_concurrently(executor):
+        return await asyncio.gather(
+            raillabel.aload(json_paths["openlabel_v1_short"], executor=executor),
+            raillabel.aload(json_paths["openlabel_v1_short"], executor=executor, frames=[1]),
+        )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        actual = asyncio.run(load_concurrently(executor))
+
+    assert actual[0] == raillabel.load(json_paths["openlabel_v1_short"])
+    assert list(actual[1].frames.keys()) == [1]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load__typed_arrays(json_paths, validate, tmp_path):
+    path = json_paths["openlabel_v1_short"]
+    expected = raillabel.load(path)
+
+    actual = raillabel.load(path, typed_arrays=True, validate=validate)
+    for annotation_id, annotation in actual.frames[0].annotations.items():
+        expected_annotation = expected.frames[0].annotations[annotation_id]
+        if isinstance(annotation, Seg3d):
+            assert isinstance(annotation.point_ids, _PointIdSequence)
+            assert isinstance(annotation.point_ids.point_ids, array)
+        elif isinstance(annotation, (Poly2d, Poly3d)):
+            assert isinstance(annotation.points, _PointSequence)
+
+    assert actual == expected
+
+    raillabel.save(actual, tmp_path / "scene.json")
+    assert raillabel.load(tmp_path / "scene.json") == expected
+
+
+def test_load__not_validated(json_paths):
+    for path in [json_paths["openlabel_v1_short"], json_paths["1_calibration_1.1_labels"]]:
+        actual = raillabel.load(path, validate=False)
+        assert actual == raillabel.load(path)
+
+
+def test_load__not_validated_saved_scene(json_paths, tmp_path):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+    raillabel.save(scene, tmp_path / "scene.json")
+
+    actual = raillabel.load(tmp_path / "scene.json", validate=False)
+    assert actual == scene
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson", "auto"])
+def test_load__json_backend(json_paths, json_backend):
+    pytest.importorskip("orjson")
+
+    actual = raillabel.load(json_paths["openlabel_v1_short"], json_backend=json_backend)
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__json_backend_from_environment(json_paths, monkeypatch):
+    monkeypatch.setenv("RAILLABEL_JSON_BACKEND", "unknown_backend")
+
+    with pytest.raises(UnknownJSONBackendError):
+        raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__unknown_json_backend(json_paths):
+    with pytest.raises(UnknownJSONBackendError):
+        raillabel.load(json_paths["openlabel_v1_short"], json_backend="unknown_backend")
+
+
+def test_load__frames(json_paths):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    frame_ids = list(scene.frames.keys())[2:5]
+
+    actual = raillabel.load(json_paths["1_calibration_1.1_labels"], frames=frame_ids)
+    assert actual.sensors == scene.sensors
+    assert actual.objects == scene.objects
+    assert actual.frames == {frame_id: scene.frames[frame_id] for frame_id in frame_ids}
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load__sensors_and_annotation_types(json_paths, validate):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+
+    actual = raillabel.load(
+        json_paths["openlabel_v1_short"],
+        sensors=["rgb_center", "lidar"],
+        annotation_types=["bbox", "seg3d"],
+        validate=validate,
+    )
+    assert set(actual.sensors.keys()) == {"rgb_center", "lidar"}
+    assert actual.objects == scene.objects
+    for frame_id, frame in actual.frames.items():
+        assert frame.timestamp == scene.frames[frame_id].timestamp
+        assert set(frame.sensors.keys()) <= {"rgb_center", "lidar"}
+        assert frame.annotations == {
+            uid: annotation
+            for uid, annotation in scene.frames[frame_id].annotations.items()
+            if annotation.sensor_id in {"rgb_center", "lidar"}
+            and isinstance(annotation, (Bbox, Seg3d))
+        }
+
+
+def test_load__lazy_frames_and_sensors(json_paths):
+    expected = raillabel.load(json_paths["openlabel_v1_short"], frames=[1], sensors=["lidar"])
+
+    actual = raillabel.load(
+        json_paths["openlabel_v1_short"], lazy=True, frames=[1], sensors=["lidar"]
+    )
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [],
+        [raillabel.filter.IncludeObjectTypeFilter(["person"])],
+        [raillabel.filter.ExcludeSensorIdFilter(["rgb_center"])],
+        [raillabel.filter.IncludeAnnotationTypeFilter(["bbox", "poly2d"])],
+        [
+            raillabel.filter.StartTimeFilter(Decimal("1631441453.4")),
+            raillabel.filter.IncludeSensorTypeFilter(["camera"]),
+        ],
+        [raillabel.filter.ExcludeFrameIdFilter([12, 13])],
+    ],
+)
+@pytest.mark.parametrize("validate", [True, False])
+def test_load__filters(json_paths, filters, validate):
+    path = json_paths["1_calibration_1.1_labels"]
+
+    actual = raillabel.load(path, filters=filters, validate=validate)
+    assert actual == raillabel.load(path).filter(filters)
+
+
+def test_load__filters_lazy(json_paths):
+    with pytest.raises(LazyFilteringError):
+        raillabel.load(json_paths["openlabel_v1_short"], lazy=True, filters=[])
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load__workers(json_paths, validate):
+    path = json_paths["1_calibration_1.1_labels"]
+
+    actual = raillabel.load(path, workers=2, validate=validate)
+    assert list(actual.frames.keys()) == list(raillabel.load(path).frames.keys())
+    assert actual == raillabel.load(path)
+
+
+def test_load__workers_with_selection(json_paths):
+    path = json_paths["1_calibration_1.1_labels"]
+    options = {"frames": range(13, 17), "sensors": ["lidar"], "json_backend": "json"}
+
+    actual = raillabel.load(path, workers=3, **options)
+    assert actual == raillabel.load(path, **options)
+
+
+def test_load__cache(json_paths, tmp_path, frame_decoding_counter):
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path)
+    frame_decoding_counter[0] = 0
+
+    actual = raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path)
+    assert frame_decoding_counter[0] == 0
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__cache_changed_file(json_data, tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text(json.dumps(json_data["openlabel_v1_short"]))
+    raillabel.load(path, cache_dir=tmp_path / "cache")
+
+    del json_data["openlabel_v1_short"]["openlabel"]["frames"]["1"]
+    path.write_text(json.dumps(json_data["openlabel_v1_short"]))
+
+    actual = raillabel.load(path, cache_dir=tmp_path / "cache")
+    assert list(actual.frames.keys()) == [0]
+
+
+def test_load__cache_arguments(json_paths, tmp_path):
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path)
+
+    actual = raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path, frames=[1])
+    assert list(actual.frames.keys()) == [1]
+
+
+def test_load__cache_unordered_arguments(json_paths, tmp_path, frame_decoding_counter):
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path, sensors=["lidar", "radar"])
+    frame_decoding_counter[0] = 0
+
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path, sensors={"radar", "lidar"})
+    assert frame_decoding_counter[0] == 0
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_load__cache_key_independent_of_hash_seed(json_paths, tmp_path):
+    script = (
+        "import sys; from raillabel.filter import IncludeSensorIdFilter; "
+        "from raillabel.load._cache import _SceneCache; "
+        "print(_SceneCache(sys.argv[2], None).key("
+        "sys.argv[1], {'rgb_center', 'lidar'}, [IncludeSensorIdFilter({'rgb_center', 'lidar'})]))"
+    )
+
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", script, json_paths["openlabel_v1_short"], tmp_path],
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for seed in range(4)
+    }
+    assert len(keys) == 1
+
+
+def test_load__cache_lazy(json_paths, tmp_path):
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path, lazy=True)
+
+    actual = raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path, lazy=True)
+    assert isinstance(actual.frames, dict)
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__cache_eviction(json_paths, tmp_path):
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path, frames=[0])
+    entry_size = next(tmp_path.iterdir()).stat().st_size
+
+    for frame_id in [1, 0]:
+        raillabel.load(
+            json_paths["openlabel_v1_short"],
+            cache_dir=tmp_path,
+            max_cache_size=2 * entry_size,
+            frames=[frame_id],
+        )
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_load__cache_corrupted_entry(json_paths, tmp_path):
+    raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path)
+    next(tmp_path.iterdir()).write_bytes(b"corrupted")
+
+    actual = raillabel.load(json_paths["openlabel_v1_short"], cache_dir=tmp_path)
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__lazy(json_paths):
+    eager = raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+    actual = raillabel.load(json_paths["1_calibration_1.1_labels"], lazy=True)
+    assert list(actual.frames.keys()) == list(eager.frames.keys())
+    assert actual == eager
+
+
+def test_load__lazy_decodes_on_access(json_paths, frame_decoding_counter):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"], lazy=True)
+    assert frame_decoding_counter[0] == 0
+
+    scene.frames[12]
+    scene.frames[12]
+    assert frame_decoding_counter[0] == 1
+
+
+def test_load__lazy_max_cached_frames(json_paths, frame_decoding_counter):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"], lazy=True, max_cached_frames=1)
+    first_frame_id, second_frame_id = list(scene.frames.keys())[:2]
+
+    scene.frames[first_frame_id]
+    scene.frames[second_frame_id]
+    scene.frames[first_frame_id]
+    assert frame_decoding_counter[0] == 3
+
+
+def test_load__lazy_assignment(json_paths):
+    scene = raillabel.load(json_paths["openlabel_v1_short"], lazy=True, max_cached_frames=0)
+
+    scene.frames[0] = Frame()
+    del scene.frames[1]
+    assert scene.frames[0] is scene.frames[0]
+    assert 1 not in scene.frames
+
+
+def test_load__lazy_not_validated(json_paths):
+    actual = raillabel.load(json_paths["openlabel_v1_short"], lazy=True, validate=False)
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load__lazy_deepcopy(json_paths):
+    scene = raillabel.load(json_paths["openlabel_v1_short"], lazy=True)
+
+    actual = copy.deepcopy(scene)
+    assert isinstance(actual.frames, dict)
+    assert actual == raillabel.load(json_paths["openlabel_v1_short"])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
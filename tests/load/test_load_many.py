@@ -0,0 +1,47 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+import raillabel
+from raillabel.load.load import LazyFilteringError
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many(json_paths, workers):
+    paths = [json_paths["openlabel_v1_short"], json_paths["1_calibration_1.1_labels"]]
+
+    actual = list(raillabel.load_many(paths, workers=workers, validate=False))
+    assert [result.path for result in actual] == paths
+    assert [result.scene for result in actual] == [raillabel.load(path) for path in paths]
+    assert all(result.error is None and result.seconds > 0 for result in actual)
+
+
+def test_load_many__unordered(json_paths):
+    paths = [json_paths["1_calibration_1.1_labels"], json_paths["openlabel_v1_short"]]
+
+    actual = list(raillabel.load_many(paths, workers=2, ordered=False))
+    assert sorted(result.path for result in actual) == sorted(paths)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many__failures(json_paths, tmp_path, workers):
+    paths = [tmp_path / "missing.json", json_paths["openlabel_v1_short"]]
+
+    actual = list(raillabel.load_many(paths, workers=workers))
+    assert isinstance(actual[0].error, FileNotFoundError)
+    assert actual[0].scene is None
+    assert actual[1].scene == raillabel.load(json_paths["openlabel_v1_short"])
+
+
+def test_load_many__unpicklable_error(json_paths):
+    actual = list(
+        raillabel.load_many([json_paths["openlabel_v1_short"]], workers=2, lazy=True, filters=[])
+    )
+    assert LazyFilteringError.__name__ in str(actual[0].error)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,54 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+import raillabel
+from raillabel.load.scene_reader import SceneReaderClosedError
+
+
+def test_scene_reader(json_paths):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+    with raillabel.SceneReader(json_paths["1_calibration_1.1_labels"]) as reader:
+        assert reader.scene.metadata == scene.metadata
+        assert reader.scene.sensors == scene.sensors
+        assert reader.scene.objects == scene.objects
+        assert reader.scene.frames == {}
+        assert reader.frame_ids == list(scene.frames.keys())
+
+        actual = dict(reader)
+
+    assert actual == scene.frames
+
+
+def test_scene_reader__not_validated(json_paths):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+
+    with raillabel.SceneReader(json_paths["openlabel_v1_short"], validate=False) as reader:
+        assert reader.scene.objects == scene.objects
+        assert dict(reader) == scene.frames
+
+
+def test_scene_reader__object_types(json_paths):
+    with raillabel.SceneReader(json_paths["openlabel_v1_short"]) as reader:
+        for _, frame in reader:
+            for annotation in frame.annotations.values():
+                object_type = reader.scene.objects[annotation.object_id].type
+                assert annotation.name(object_type).endswith(object_type)
+
+
+def test_scene_reader__closed(json_paths):
+    with raillabel.SceneReader(json_paths["openlabel_v1_short"]) as reader:
+        frames = iter(reader)
+        next(frames)
+
+    assert reader.scene.metadata is not None
+    with pytest.raises(SceneReaderClosedError):
+        next(frames)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,82 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from decimal import Decimal
+from uuid import UUID
+
+import pydantic_core
+import pytest
+
+import raillabel
+from raillabel.format import Bbox, Frame, Num, Object, Point2d, Poly2d, Seg3d, Size2d
+from raillabel.save._encoder import _frame_to_dict
+
+
+def assert_same_as_pydantic(frame, objects):
+    expected = frame.to_json(objects)
+
+    actual = _frame_to_dict(frame, objects)
+    assert actual == expected.model_dump(mode="json", exclude_none=True)
+    assert pydantic_core.to_json(actual) == expected.model_dump_json(exclude_none=True).encode()
+    assert (
+        pydantic_core.to_json(actual, indent=4)
+        == expected.model_dump_json(exclude_none=True, indent=4).encode()
+    )
+
+
+def test_frame_to_dict(frame, objects):
+    assert_same_as_pydantic(frame, objects)
+
+
+@pytest.mark.parametrize("typed_arrays", [False, True])
+def test_frame_to_dict__files(json_paths, typed_arrays):
+    for path in json_paths.values():
+        if "schema" in path.name:
+            continue
+
+        scene = raillabel.load(path, typed_arrays=typed_arrays)
+        for frame in scene.frames.values():
+            assert_same_as_pydantic(frame, scene.objects)
+
+
+def test_frame_to_dict__values_converted_like_pydantic():
+    object_id = UUID("b40ba3ad-0327-46ff-9c28-2506cfd6d934")
+    objects = {object_id: Object(name="person_0000", type="person")}
+    frame = Frame(
+        timestamp=Decimal("1E+3"),
+        frame_data={"speed": Num(name="speed", val=3)},
+        annotations={
+            UUID("f3bd7be1-2e2f-4b5b-9d4d-b5b5a2fd8a8b"): Bbox(
+                pos=Point2d(1, 2),
+                size=Size2d(3, 4),
+                object_id=object_id,
+                sensor_id="rgb_middle",
+                attributes={"count": 2, "is_visible": True, "mixed": [1, "a", 2.5], "empty": []},
+            ),
+            UUID("5f0b6e47-6d5d-4b24-9b36-5e7e2fd9d3a5"): Poly2d(
+                points=[Point2d(1, 2), Point2d(3.5, 4)],
+                closed=True,
+                object_id=object_id,
+                sensor_id="rgb_middle",
+                attributes={},
+            ),
+            UUID("0d42b2b4-0c8f-4e0f-8f1c-6d7f0b1a5c3e"): Seg3d(
+                point_ids=[1, 2, 3],
+                object_id=object_id,
+                sensor_id="lidar",
+                attributes={"precision": 1e-7},
+            ),
+        },
+    )
+
+    assert_same_as_pydantic(frame, objects)
+
+
+def test_frame_to_dict__empty_frame():
+    assert_same_as_pydantic(Frame(), {})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,11 +3,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+
 import pytest
 
 import raillabel
 from raillabel import Scene
+from raillabel._json_backend import _get_json_backend
 from raillabel.json_format import JSONScene
+from raillabel.save import save as save_module
 
 
 def test_save(json_data, tmp_path):
@@ -19,5 +24,226 @@ def test_save(json_data, tmp_path):
     assert actual == ground_truth_scene
 
 
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_save__same_as_serializing_at_once(json_paths, tmp_path, prettify_json):
+    scene_path = tmp_path / "scene.json"
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, scene_path, prettify_json)
+
+    expected = scene.to_json().model_dump_json(
+        exclude_none=True, indent=4 if prettify_json else None
+    )
+    assert scene_path.read_text() == expected
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_save__json_backend_same_as_serializing_at_once(
+    json_paths, tmp_path, json_backend, prettify_json
+):
+    pytest.importorskip("orjson")
+    scene_path = tmp_path / "scene.json"
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, scene_path, prettify_json, json_backend)
+
+    expected = _get_json_backend(json_backend).dumps(
+        scene.to_json().model_dump(mode="json", exclude_none=True), prettify_json
+    )
+    assert scene_path.read_bytes() == expected
+
+
+@pytest.mark.parametrize("json_backend", [None, "json"])
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_save__workers(json_paths, tmp_path, json_backend, prettify_json):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, tmp_path / "serial.json", prettify_json, json_backend)
+    raillabel.save(scene, tmp_path / "parallel.json", prettify_json, json_backend, workers=2)
+
+    actual = (tmp_path / "parallel.json").read_bytes()
+    assert actual == (tmp_path / "serial.json").read_bytes()
+
+
+def test_save__workers_lazy_scene(json_paths, tmp_path):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, tmp_path / "serial.json")
+
+    lazy_scene = raillabel.load(
+        json_paths["1_calibration_1.1_labels"], lazy=True, max_cached_frames=1
+    )
+    raillabel.save(lazy_scene, tmp_path / "parallel.json", workers=2)
+
+    actual = (tmp_path / "parallel.json").read_bytes()
+    assert actual == (tmp_path / "serial.json").read_bytes()
+
+
+def test_asave(json_data, tmp_path):
+    scene_path = tmp_path / "scene.json"
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    asyncio.run(raillabel.asave(ground_truth_scene, scene_path, prettify_json=True))
+
+    actual = raillabel.load(scene_path)
+    assert actual == ground_truth_scene
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson", "auto"])
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_save__json_backend(json_data, tmp_path, json_backend, prettify_json):
+    pytest.importorskip("orjson")
+    scene_path = tmp_path / "scene.json"
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    raillabel.save(ground_truth_scene, scene_path, prettify_json, json_backend=json_backend)
+
+    actual = raillabel.load(scene_path)
+    assert actual == ground_truth_scene
+
+
+def test_save__json_backend_from_environment(json_data, tmp_path, monkeypatch):
+    monkeypatch.setenv("RAILLABEL_JSON_BACKEND", "json")
+    scene_path = tmp_path / "scene.json"
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    raillabel.save(ground_truth_scene, scene_path)
+
+    actual = raillabel.load(scene_path)
+    assert actual == ground_truth_scene
+
+
+@pytest.mark.parametrize("suffix", [".json.gz", ".json.xz", ".json.bz2", ".json.zst"])
+def test_save__compressed(json_data, tmp_path, suffix):
+    if suffix == ".json.zst":
+        pytest.importorskip("zstandard")
+    scene_path = tmp_path / ("scene" + suffix)
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    raillabel.save(ground_truth_scene, scene_path)
+
+    assert not scene_path.read_bytes().startswith(b"{")
+    assert raillabel.load(scene_path) == ground_truth_scene
+    assert raillabel.load(scene_path, lazy=True) == ground_truth_scene
+    assert dict(raillabel.iter_frames(scene_path)) == ground_truth_scene.frames
+
+
+def test_save__compressed_detected_by_content(json_data, tmp_path):
+    scene_path = tmp_path / "scene.json.gz"
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    raillabel.save(ground_truth_scene, scene_path)
+    renamed_path = scene_path.rename(tmp_path / "scene.json")
+
+    actual = raillabel.load(renamed_path)
+    assert actual == ground_truth_scene
+
+
+@pytest.mark.parametrize("suffix", [".json", ".json.gz", ".json.zst"])
+def test_save__atomic(json_data, tmp_path, suffix):
+    if suffix == ".json.zst":
+        pytest.importorskip("zstandard")
+    scene_path = tmp_path / ("scene" + suffix)
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    raillabel.save(ground_truth_scene, scene_path, atomic=True)
+
+    assert raillabel.load(scene_path) == ground_truth_scene
+    assert list(tmp_path.iterdir()) == [scene_path]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_save__lazy_scene_to_its_own_file(json_paths, tmp_path, workers):
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_bytes(json_paths["1_calibration_1.1_labels"].read_bytes())
+    ground_truth_scene = raillabel.load(scene_path)
+
+    scene = raillabel.load(scene_path, lazy=True)
+    raillabel.save(scene, scene_path, workers=workers)
+
+    assert raillabel.load(scene_path) == ground_truth_scene
+    assert list(tmp_path.iterdir()) == [scene_path]
+
+
+def test_save__lazy_scene_to_another_file_in_place(json_paths, tmp_path):
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_text("previous content")
+    inode = scene_path.stat().st_ino
+
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"], lazy=True)
+    raillabel.save(scene, scene_path)
+
+    assert scene_path.stat().st_ino == inode
+    assert raillabel.load(scene_path) == raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+
+def test_save__symlink_kept(json_data, tmp_path):
+    target_path = tmp_path / "target.json"
+    target_path.write_text("previous content")
+    scene_path = tmp_path / "scene.json"
+    scene_path.symlink_to(target_path)
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+
+    raillabel.save(ground_truth_scene, scene_path)
+
+    assert scene_path.is_symlink()
+    assert raillabel.load(target_path) == ground_truth_scene
+
+
+def test_save__hardlink_kept(json_data, tmp_path):
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_text("previous content")
+    link_path = tmp_path / "link.json"
+    os.link(scene_path, link_path)
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+
+    raillabel.save(ground_truth_scene, scene_path)
+
+    assert raillabel.load(link_path) == ground_truth_scene
+
+
+def test_save__atomic_keeps_permissions(json_data, tmp_path):
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_text("{}")
+    scene_path.chmod(0o640)
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+    raillabel.save(ground_truth_scene, scene_path, atomic=True)
+
+    assert scene_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_save__atomic_interrupted(json_data, tmp_path, monkeypatch):
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_text("previous content")
+    ground_truth_scene = Scene.from_json(JSONScene(**json_data["openlabel_v1_short"]))
+
+    def interrupt(*_):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(save_module, "_write_scene", interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        raillabel.save(ground_truth_scene, scene_path, atomic=True)
+
+    assert scene_path.read_text() == "previous content"
+    assert list(tmp_path.iterdir()) == [scene_path]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_save__compact(json_paths, tmp_path, workers):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, tmp_path / "full.json")
+    raillabel.save(scene, tmp_path / "compact.json", compact=True, workers=workers)
+
+    raw = (tmp_path / "compact.json").read_bytes()
+    assert len(raw) < (tmp_path / "full.json").stat().st_size
+    assert b"object_data_pointers" not in raw
+    assert b"frame_intervals" not in raw
+
+    assert raillabel.load(tmp_path / "compact.json") == scene
+    assert raillabel.load(tmp_path / "compact.json", validate=False) == scene
+    assert raillabel.load(tmp_path / "compact.json", lazy=True) == scene
+
+
+def test_save__compact_derived_data_restored(json_paths, tmp_path):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    raillabel.save(scene, tmp_path / "compact.json", compact=True)
+    raillabel.save(scene, tmp_path / "expected.json")
+
+    raillabel.save(raillabel.load(tmp_path / "compact.json"), tmp_path / "actual.json")
+    assert (tmp_path / "actual.json").read_bytes() == (tmp_path / "expected.json").read_bytes()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
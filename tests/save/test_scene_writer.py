@@ -0,0 +1,97 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from uuid import UUID
+
+import pytest
+
+import raillabel
+from raillabel.format import Frame, Metadata
+from raillabel.save.scene_writer import (
+    DuplicateFrameError,
+    SceneWriterClosedError,
+    UnknownObjectError,
+)
+
+
+def _write(scene, path, **kwargs):
+    with raillabel.SceneWriter(path, scene.metadata, **kwargs) as writer:
+        for sensor_id, sensor in scene.sensors.items():
+            writer.add_sensor(sensor_id, sensor)
+        for object_id, obj in scene.objects.items():
+            writer.add_object(object_id, obj)
+        for frame_id, frame in scene.frames.items():
+            writer.write_frame(frame_id, frame)
+
+
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_scene_writer(json_paths, tmp_path, prettify_json):
+    scene = raillabel.load(json_paths["1_calibration_1.1_labels"])
+    _write(scene, tmp_path / "written.json", prettify_json=prettify_json)
+    raillabel.save(scene, tmp_path / "saved.json")
+
+    actual = json.loads((tmp_path / "written.json").read_text())
+    assert actual == json.loads((tmp_path / "saved.json").read_text())
+    assert raillabel.load(tmp_path / "written.json") == scene
+
+
+def test_scene_writer__compressed(json_paths, tmp_path):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+    _write(scene, tmp_path / "scene.json.gz", json_backend="json")
+
+    assert raillabel.load(tmp_path / "scene.json.gz") == scene
+
+
+def test_scene_writer__empty(tmp_path):
+    with raillabel.SceneWriter(tmp_path / "scene.json", Metadata(schema_version="1.0.0")):
+        pass
+
+    actual = raillabel.load(tmp_path / "scene.json")
+    assert actual == raillabel.Scene(metadata=Metadata(schema_version="1.0.0"))
+
+
+def test_scene_writer__unknown_object(json_paths, tmp_path):
+    scene = raillabel.load(json_paths["openlabel_v1_short"])
+
+    with raillabel.SceneWriter(tmp_path / "scene.json", scene.metadata) as writer:
+        with pytest.raises(UnknownObjectError):
+            writer.write_frame(0, scene.frames[0])
+
+
+def test_scene_writer__duplicate_frame(tmp_path):
+    with raillabel.SceneWriter(tmp_path / "scene.json", Metadata(schema_version="1.0.0")) as writer:
+        writer.write_frame(1, Frame())
+        with pytest.raises(DuplicateFrameError):
+            writer.write_frame(1, Frame())
+
+    assert list(raillabel.load(tmp_path / "scene.json").frames.keys()) == [1]
+
+
+def test_scene_writer__closed(tmp_path):
+    writer = raillabel.SceneWriter(tmp_path / "scene.json", Metadata(schema_version="1.0.0"))
+    writer.close()
+
+    with pytest.raises(SceneWriterClosedError):
+        writer.write_frame(1, Frame())
+
+
+def test_scene_writer__exception_not_finalized(tmp_path):
+    scene_path = tmp_path / "scene.json"
+
+    with pytest.raises(RuntimeError):
+        with raillabel.SceneWriter(scene_path, Metadata(schema_version="1.0.0")) as writer:
+            writer.write_frame(1, Frame())
+            raise RuntimeError
+
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(scene_path.read_text())
+
+    with pytest.raises(SceneWriterClosedError):
+        writer.write_frame(2, Frame())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
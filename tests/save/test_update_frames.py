@@ -0,0 +1,155 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from copy import deepcopy
+from uuid import UUID
+
+import pytest
+
+import raillabel
+from raillabel.format import Frame, Metadata, Object, Point2d
+from raillabel.save import scene_writer
+from raillabel.save.update_frames import UnknownObjectError
+
+
+@pytest.fixture
+def scene(json_paths):
+    return raillabel.load(json_paths["1_calibration_1.1_labels"])
+
+
+def _changed_frame(frame):
+    frame = deepcopy(frame)
+    for annotation in frame.annotations.values():
+        if hasattr(annotation, "pos") and isinstance(annotation.pos, Point2d):
+            annotation.pos = Point2d(annotation.pos.x + 1, annotation.pos.y)
+    return frame
+
+
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_update_frames__replace(scene, tmp_path, prettify_json):
+    path = tmp_path / "scene.json"
+    raillabel.save(scene, path, prettify_json=prettify_json)
+
+    expected = deepcopy(scene)
+    expected.frames[15] = _changed_frame(scene.frames[15])
+    raillabel.save(expected, tmp_path / "expected.json", prettify_json=prettify_json)
+
+    raillabel.update_frames(path, {15: expected.frames[15]})
+    assert path.read_bytes() == (tmp_path / "expected.json").read_bytes()
+
+
+@pytest.mark.parametrize("prettify_json", [False, True])
+def test_update_frames__append(scene, tmp_path, prettify_json):
+    path = tmp_path / "scene.json"
+    raillabel.save(scene, path, prettify_json=prettify_json)
+
+    expected = deepcopy(scene)
+    expected.frames[100] = _changed_frame(scene.frames[15])
+    expected.frames[101] = Frame()
+    raillabel.save(expected, tmp_path / "expected.json", prettify_json=prettify_json)
+
+    raillabel.update_frames(path, {100: expected.frames[100], 101: expected.frames[101]})
+    assert path.read_bytes() == (tmp_path / "expected.json").read_bytes()
+
+
+def test_update_frames__new_object(scene, tmp_path):
+    path = tmp_path / "scene.json"
+    raillabel.save(scene, path)
+
+    object_id = UUID("7ab5f2a8-0b9c-4a1f-9d7e-3f2a1b0c9d8e")
+    frame = _changed_frame(scene.frames[15])
+    for annotation in frame.annotations.values():
+        annotation.object_id = object_id
+    obj = Object(name="person_9999", type="person")
+
+    raillabel.update_frames(path, {15: frame}, {object_id: obj})
+
+    actual = raillabel.load(path)
+    assert actual.objects[object_id] == obj
+    assert actual.frames[15] == frame
+
+    expected = json.loads(actual.to_json().model_dump_json(exclude_none=True))["openlabel"]
+    assert json.loads(path.read_text())["openlabel"]["objects"] == expected["objects"]
+
+
+def test_update_frames__unknown_object(scene, tmp_path):
+    path = tmp_path / "scene.json"
+    raillabel.save(scene, path)
+    previous_content = path.read_bytes()
+
+    frame = deepcopy(scene.frames[15])
+    next(iter(frame.annotations.values())).object_id = UUID("7ab5f2a8-0b9c-4a1f-9d7e-3f2a1b0c9d8e")
+
+    with pytest.raises(UnknownObjectError):
+        raillabel.update_frames(path, {15: frame})
+
+    assert path.read_bytes() == previous_content
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_update_frames__unknown_object_error_shared_with_scene_writer():
+    assert UnknownObjectError is scene_writer.UnknownObjectError
+
+
+def test_update_frames__frame_index(scene, tmp_path):
+    path = tmp_path / "scene.json"
+    raillabel.save(scene, path)
+    raillabel.write_frame_index(path)
+
+    frame = _changed_frame(scene.frames[15])
+    raillabel.update_frames(path, {15: frame, 100: frame})
+
+    actual = raillabel.read_frame_index(path)
+    raillabel.write_frame_index(path)
+    assert actual == raillabel.read_frame_index(path)
+    assert raillabel.load(path, frames=[100]).frames[100] == frame
+
+
+def test_update_frames__compact(scene, tmp_path):
+    path = tmp_path / "scene.json"
+    raillabel.save(scene, path, compact=True)
+
+    expected = deepcopy(scene)
+    expected.frames[15] = _changed_frame(scene.frames[15])
+    expected.frames[100] = expected.frames[15]
+    raillabel.update_frames(path, {15: expected.frames[15], 100: expected.frames[100]})
+
+    raw = path.read_bytes()
+    assert b"object_data_pointers" not in raw
+    assert raillabel.load(path) == expected
+
+
+def test_update_frames__first_object(scene, tmp_path):
+    path = tmp_path / "scene.json"
+    raillabel.save(raillabel.Scene(metadata=scene.metadata, sensors=scene.sensors), path)
+
+    expected = raillabel.Scene(metadata=scene.metadata, sensors=scene.sensors)
+    expected.objects = scene.objects
+    expected.frames[15] = scene.frames[15]
+    raillabel.save(expected, tmp_path / "expected.json")
+
+    raillabel.update_frames(path, {15: scene.frames[15]}, scene.objects)
+    assert json.loads(path.read_bytes()) == json.loads((tmp_path / "expected.json").read_bytes())
+
+
+def test_update_frames__empty_frames(tmp_path):
+    path = tmp_path / "scene.json"
+    raillabel.save(raillabel.Scene(metadata=Metadata(schema_version="1.0.0")), path)
+
+    raillabel.update_frames(path, {0: Frame()})
+    assert raillabel.load(path).frames == {0: Frame()}
+
+
+def test_update_frames__without_frames(tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text('{"openlabel": {"metadata": {"schema_version": "1.0.0"}}}')
+
+    raillabel.update_frames(path, {0: Frame()})
+    assert raillabel.load(path).frames == {0: Frame()}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])